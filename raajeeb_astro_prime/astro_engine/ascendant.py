@@ -0,0 +1,47 @@
+"""Vectorized tropical ascendant from obliquity, local sidereal time and latitude."""
+
+from __future__ import annotations
+
+import numpy as np
+
+J2000_JD = 2451545.0
+
+
+def mean_obliquity(jd: np.ndarray) -> np.ndarray:
+    """Return the IAU 2006 mean obliquity of the ecliptic in degrees."""
+    t = (np.asarray(jd, dtype=float) - J2000_JD) / 36525.0
+    return (84381.406 + t * (-46.836769 + t * (-0.0001831 + t * (0.00200340 + t * (-0.000000576 - t * 0.0000000434))))) / 3600.0
+
+
+def nutation(jd: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return nutation in longitude and obliquity in degrees from the four largest terms."""
+    t = (np.asarray(jd, dtype=float) - J2000_JD) / 36525.0
+    node = np.radians(125.04452 - 1934.136261 * t)
+    sun = np.radians(2 * (280.4665 + 36000.7698 * t))
+    moon = np.radians(2 * (218.3165 + 481267.8813 * t))
+    dpsi = -17.20 * np.sin(node) - 1.32 * np.sin(sun) - 0.23 * np.sin(moon) + 0.21 * np.sin(2 * node)
+    deps = 9.20 * np.cos(node) + 0.57 * np.cos(sun) + 0.10 * np.cos(moon) - 0.09 * np.cos(2 * node)
+    return dpsi / 3600.0, deps / 3600.0
+
+
+def greenwich_sidereal_degrees(jd: np.ndarray) -> np.ndarray:
+    """Return Greenwich mean sidereal time in degrees for UT Julian days."""
+    d = np.asarray(jd, dtype=float) - J2000_JD
+    t = d / 36525.0
+    return (280.46061837 + 360.98564736629 * d + t * t * (0.000387933 - t / 38710000.0)) % 360.0
+
+
+def ascendant_longitudes(jd: np.ndarray, latitude: np.ndarray, longitude: np.ndarray) -> np.ndarray:
+    """Return apparent tropical ascendant longitudes in degrees.
+
+    Inputs broadcast against each other, so one call can cover many instants at
+    one place, one instant at many places, or paired arrays of both.
+    Latitudes are in degrees north, longitudes in degrees east.
+    """
+    dpsi, deps = nutation(jd)
+    eps_deg = mean_obliquity(jd) + deps
+    ramc = np.radians(greenwich_sidereal_degrees(jd) + dpsi * np.cos(np.radians(eps_deg)) + np.asarray(longitude, dtype=float))
+    eps = np.radians(eps_deg)
+    phi = np.radians(np.asarray(latitude, dtype=float))
+    asc = np.arctan2(np.cos(ramc), -(np.sin(ramc) * np.cos(eps) + np.tan(phi) * np.sin(eps)))
+    return np.degrees(asc) % 360.0
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from raajeeb_astro_prime.models.astro_core import Chart
 from raajeeb_astro_prime.models.compatibility import CompatibilityResult
+from .vedic_calculations import SIGN_INDEX, SIGNS
 
 KUTA_MAX = {
     "Varna": 1,
@@ -16,6 +17,8 @@ KUTA_MAX = {
     "Nadi": 8,
 }
 
+SIGN_SEEDS = [sum(ord(c) for c in name) for name in SIGNS]
+
 
 def _pseudo_score(seed_a: int, seed_b: int, max_score: int) -> float:
     return float((seed_a + seed_b) % (max_score + 1))
@@ -23,8 +26,8 @@ def _pseudo_score(seed_a: int, seed_b: int, max_score: int) -> float:
 
 def compute_ashta_kuta(chart_a: Chart, chart_b: Chart) -> CompatibilityResult:
     """Compute deterministic Ashta Kuta score from Moon and Lagna features."""
-    seed_a = sum(ord(c) for c in chart_a.moon_sign + chart_a.lagna_sign)
-    seed_b = sum(ord(c) for c in chart_b.moon_sign + chart_b.lagna_sign)
+    seed_a = SIGN_SEEDS[SIGN_INDEX[chart_a.moon_sign]] + SIGN_SEEDS[SIGN_INDEX[chart_a.lagna_sign]]
+    seed_b = SIGN_SEEDS[SIGN_INDEX[chart_b.moon_sign]] + SIGN_SEEDS[SIGN_INDEX[chart_b.lagna_sign]]
     per: dict[str, float] = {}
     for kuta, max_score in KUTA_MAX.items():
         per[kuta] = min(_pseudo_score(seed_a, seed_b + len(kuta), max_score), float(max_score))
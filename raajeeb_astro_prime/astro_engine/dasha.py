@@ -1,11 +1,18 @@
-"""Vimshottari Dasha calculations."""
+"""Dasha calculations: Vimshottari, Yogini and Ashtottari on one shared period engine."""
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
-from itertools import cycle
+from array import array
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
+from typing import Iterator, Optional
+
+import numpy as np
 
 from raajeeb_astro_prime.models.astro_core import DashaPeriod
+from .intervals import IntervalIndex
+from .vedic_calculations import datetime_from_julian_day, julian_day, nakshatra_pada_indices
 
 DASHA_ORDER = ["Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury"]
 DASHA_YEARS = {
@@ -19,63 +26,491 @@ DASHA_YEARS = {
     "Saturn": 19,
     "Mercury": 17,
 }
+TOTAL_YEARS = 120
+
+LEVELS = ("maha", "antar", "pratyantar", "sookshma", "prana")
+
+# Nakshatra lords repeat the dasha order from Ashwini (Ketu) three times round the zodiac.
+NAKSHATRA_LORDS = tuple(DASHA_ORDER[i % 9] for i in range(27))
+NAKSHATRA_SPAN = 360.0 / 27
+
+# Lords are stored as small-int codes: positions in a system's lord order.
+LORD_CODES = {lord: code for code, lord in enumerate(DASHA_ORDER)}
+BATCH_ROWS = 16384  # births per chunk, keeping the (rows, n * n + 1) boundary arrays small
 
 
 def _years_to_days(years: float) -> float:
     return years * 365.2425
 
 
-def build_vimshottari_periods(start_lord: str, birth_dt_utc: datetime, years: int = 120) -> list[DashaPeriod]:
-    """Build Mahadasha and Antardasha periods from a start lord."""
-    periods: list[DashaPeriod] = []
-    cursor = birth_dt_utc.astimezone(timezone.utc)
-    start_idx = DASHA_ORDER.index(start_lord)
-    lords = DASHA_ORDER[start_idx:] + DASHA_ORDER[:start_idx]
-
-    for maha_lord in lords:
-        maha_days = _years_to_days(DASHA_YEARS[maha_lord])
-        maha_end = cursor + timedelta(days=maha_days)
-        maha_id = f"maha-{maha_lord}-{cursor.date()}"
-        periods.append(
-            DashaPeriod(
-                id=maha_id,
-                level="maha",
-                lord=maha_lord,
-                start_datetime=cursor,
-                end_datetime=maha_end,
-                parent_ids=[],
-            )
+@dataclass(frozen=True)
+class DashaSystem:
+    """A nakshatra-based dasha system.
+
+    ``lords`` run in cyclic order with ``years`` each; every level splits its
+    parent among all lords from the parent's own lord, in proportion to their
+    years. ``nakshatra_lords`` gives the code of the lord ruling each
+    nakshatra from Ashwini. A run of consecutive nakshatras with the same lord
+    forms one group, and the first period at birth is already part-way
+    through by the Moon's progress across that whole group. Short cycles
+    repeat ``rounds`` times to cover a lifetime.
+    """
+
+    name: str
+    lords: tuple[str, ...]
+    years: tuple[float, ...]
+    nakshatra_lords: tuple[int, ...]
+    rounds: int = 1
+
+    @property
+    def total_years(self) -> float:
+        return sum(self.years)
+
+    def code(self, lord: str) -> int:
+        return self.lords.index(lord)
+
+    @cached_property
+    def _groups(self) -> tuple[np.ndarray, np.ndarray]:
+        """Per nakshatra: its position within its group, and the group size."""
+        lords = self.nakshatra_lords
+        position = np.zeros(27, dtype=np.int64)
+        size = np.zeros(27, dtype=np.int64)
+        for nakshatra, lord in enumerate(lords):
+            before = 0
+            while before < 26 and lords[(nakshatra - before - 1) % 27] == lord:
+                before += 1
+            after = 0
+            while after < 26 - before and lords[(nakshatra + after + 1) % 27] == lord:
+                after += 1
+            position[nakshatra], size[nakshatra] = before, before + after + 1
+        return position, size
+
+    def starting_points(self, moon_longitudes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return the first mahadasha lord codes and the fraction of it elapsed at birth."""
+        lon = np.mod(np.asarray(moon_longitudes, dtype=float), 360.0)
+        nakshatra, _ = nakshatra_pada_indices(lon)
+        position, size = self._groups
+        covered = position[nakshatra] * NAKSHATRA_SPAN + (lon - nakshatra * NAKSHATRA_SPAN)
+        elapsed = np.clip(covered / (size[nakshatra] * NAKSHATRA_SPAN), 0.0, 1.0)
+        return np.array(self.nakshatra_lords, dtype=np.int8)[nakshatra], elapsed
+
+    @cached_property
+    def antar_offsets(self) -> np.ndarray:
+        """Years from the first mahadasha start to each antardasha start, plus the end of all rounds, per starting lord."""
+        n = len(self.lords)
+        columns = n * n * self.rounds
+        table = np.empty((n, columns + 1))
+        for first in range(n):
+            cursor, col = 0.0, 0
+            for k in range(n * self.rounds):
+                maha = (first + k) % n
+                for a in range(n):
+                    table[first, col] = cursor
+                    cursor += self.years[maha] * self.years[(maha + a) % n] / self.total_years
+                    col += 1
+            table[first, columns] = cursor
+        return table
+
+    @cached_property
+    def maha_codes(self) -> np.ndarray:
+        """Mahadasha lord code of each antardasha column, per starting lord."""
+        n = len(self.lords)
+        return ((np.arange(n)[:, None] + np.arange(n * n * self.rounds) // n) % n).astype(np.int8)
+
+    @cached_property
+    def antar_codes(self) -> np.ndarray:
+        """Antardasha lord code of each antardasha column, per starting lord."""
+        n = len(self.lords)
+        return ((self.maha_codes + np.arange(n * n * self.rounds) % n) % n).astype(np.int8)
+
+
+VIMSHOTTARI = DashaSystem(
+    "vimshottari",
+    tuple(DASHA_ORDER),
+    tuple(DASHA_YEARS[lord] for lord in DASHA_ORDER),
+    tuple(i % 9 for i in range(27)),
+)
+# Yogini: nakshatra number (Ashwini = 1) plus 3, modulo 8, gives the yogini number (0 meaning 8).
+YOGINI = DashaSystem(
+    "yogini",
+    ("Mangala", "Pingala", "Dhanya", "Bhramari", "Bhadrika", "Ulka", "Siddha", "Sankata"),
+    (1, 2, 3, 4, 5, 6, 7, 8),
+    tuple((i + 3) % 8 for i in range(27)),
+    rounds=4,
+)
+# Ashtottari: groups of 4, 3, 4, 3, ... nakshatras from Ardra. Abhijit is not split out,
+# so Saturn's group is Purva Ashadha, Uttara Ashadha and Shravana.
+_ASHTOTTARI_GROUPS = (4, 3, 4, 3, 3, 3, 4, 3)
+ASHTOTTARI = DashaSystem(
+    "ashtottari",
+    ("Sun", "Moon", "Mars", "Mercury", "Saturn", "Jupiter", "Rahu", "Venus"),
+    (6, 15, 8, 17, 10, 19, 12, 21),
+    tuple(
+        code
+        for _, code in sorted(
+            ((5 + sum(_ASHTOTTARI_GROUPS[:code]) + k) % 27, code)
+            for code, size in enumerate(_ASHTOTTARI_GROUPS)
+            for k in range(size)
         )
+    ),
+)
+DASHA_SYSTEMS = {system.name: system for system in (VIMSHOTTARI, YOGINI, ASHTOTTARI)}
+
+
+class DashaTable:
+    """Columnar storage for a lazily expanded dasha tree.
+
+    Row ``r`` is one period: ``start[r]``/``end[r]`` in UTC Julian days,
+    ``lord[r]`` a lord code, ``level[r]`` a position in ``LEVELS`` and
+    ``parent[r]`` the parent row (-1 for mahadashas). The sub-periods of a row
+    are appended as one contiguous block of ``len(system.lords)`` rows starting
+    at ``first_child[r]`` (-1 until expanded), so sibling lookups bisect a
+    window of ``start``. The mahadashas of all rounds are the block at row 0.
+    """
+
+    def __init__(self, system: DashaSystem = VIMSHOTTARI) -> None:
+        self.system = system
+        self.block = len(system.lords)
+        self.top = self.block * system.rounds
+        self.start = array("d")
+        self.end = array("d")
+        self.lord = array("b")
+        self.level = array("b")
+        self.parent = array("i")
+        self.first_child = array("i")
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def append_sequence(
+        self, first_lord: int, start_jd: float, span_days: float, level: int, parent: int, rounds: int = 1
+    ) -> int:
+        """Append ``rounds`` of ``span_days`` split among all lords from ``first_lord``; return the block's first row."""
+        first = len(self.start)
+        years, total = self.system.years, self.system.total_years
+        cursor = start_jd
+        for k in range(self.block * rounds):
+            lord = (first_lord + k) % self.block
+            end = cursor + span_days * years[lord] / total
+            self.start.append(cursor)
+            self.end.append(end)
+            self.lord.append(lord)
+            self.level.append(level)
+            self.parent.append(parent)
+            self.first_child.append(-1)
+            cursor = end
+        return first
+
+    def children(self, row: int) -> int:
+        """Return the first row of ``row``'s sub-period block, generating it on first use."""
+        first = self.first_child[row]
+        if first < 0:
+            level = self.level[row] + 1
+            if level >= len(LEVELS):
+                raise ValueError(f"{LEVELS[-1]} periods have no sub-periods")
+            first = self.append_sequence(self.lord[row], self.start[row], self.end[row] - self.start[row], level, row)
+            self.first_child[row] = first
+        return first
+
+    def siblings(self, first: int) -> IntervalIndex:
+        """Return the interval index over the sibling block starting at ``first``."""
+        return IntervalIndex(self.start, self.end, first, first + (self.top if first == 0 else self.block))
+
+    def lords(self, row: int) -> list[str]:
+        """Return the lord path from the mahadasha down to ``row``."""
+        path: list[str] = []
+        while row >= 0:
+            path.append(self.system.lords[self.lord[row]])
+            row = self.parent[row]
+        return path[::-1]
+
+    def period_id(self, row: int) -> str:
+        return f"{LEVELS[self.level[row]]}-{'-'.join(self.lords(row))}-{datetime_from_julian_day(self.start[row]).date()}"
+
+    def to_model(self, row: int) -> DashaPeriod:
+        """Convert one row to the serializable ``DashaPeriod`` model."""
+        parents: list[str] = []
+        node = self.parent[row]
+        while node >= 0:
+            parents.insert(0, self.period_id(node))
+            node = self.parent[node]
+        return DashaPeriod(
+            id=self.period_id(row),
+            level=LEVELS[self.level[row]],
+            lord=self.system.lords[self.lord[row]],
+            start_datetime=datetime_from_julian_day(self.start[row]),
+            end_datetime=datetime_from_julian_day(self.end[row]),
+            parent_ids=parents,
+        )
+
+
+class DashaNode:
+    """Lightweight view of one ``DashaTable`` row."""
+
+    __slots__ = ("table", "row")
+
+    def __init__(self, table: DashaTable, row: int) -> None:
+        self.table = table
+        self.row = row
+
+    @property
+    def lord(self) -> str:
+        return self.table.system.lords[self.table.lord[self.row]]
+
+    @property
+    def level(self) -> int:
+        return self.table.level[self.row]
+
+    @property
+    def start_jd(self) -> float:
+        return self.table.start[self.row]
+
+    @property
+    def end_jd(self) -> float:
+        return self.table.end[self.row]
+
+    @property
+    def parent(self) -> Optional[DashaNode]:
+        row = self.table.parent[self.row]
+        return None if row < 0 else DashaNode(self.table, row)
+
+    def children(self) -> list[DashaNode]:
+        """Return the sub-periods, starting from this period's own lord."""
+        if self.level + 1 >= len(LEVELS):
+            return []
+        first = self.table.children(self.row)
+        return [DashaNode(self.table, row) for row in range(first, first + self.table.block)]
+
+    def contains(self, jd: float) -> bool:
+        return self.start_jd <= jd < self.end_jd
+
+    def lords(self) -> list[str]:
+        return self.table.lords(self.row)
 
-        antar_cursor = cursor
-        for antar_lord in DASHA_ORDER:
-            antar_years = DASHA_YEARS[maha_lord] * DASHA_YEARS[antar_lord] / 120
-            antar_end = antar_cursor + timedelta(days=_years_to_days(antar_years))
-            antar_id = f"antar-{maha_lord}-{antar_lord}-{antar_cursor.date()}"
-            periods.append(
-                DashaPeriod(
-                    id=antar_id,
-                    level="antar",
-                    lord=antar_lord,
-                    start_datetime=antar_cursor,
-                    end_datetime=antar_end,
-                    parent_ids=[maha_id],
-                )
-            )
-            antar_cursor = antar_end
-        cursor = maha_end
-        if (cursor - birth_dt_utc).days > _years_to_days(years):
+    @property
+    def period_id(self) -> str:
+        return self.table.period_id(self.row)
+
+    def to_model(self) -> DashaPeriod:
+        return self.table.to_model(self.row)
+
+
+class DashaTree:
+    """Lazy dasha tree for one birth, from mahadasha down to prana level.
+
+    The first mahadasha is the lord of the Moon's nakshatra group, already
+    part-way through at birth in proportion to the distance the Moon has
+    covered in that group. Only the branches a query touches are ever
+    generated, as rows of a ``DashaTable``; the mahadashas are the first block.
+    """
+
+    def __init__(self, system: DashaSystem, birth_jd: float, moon_longitude: float) -> None:
+        codes, elapsed = system.starting_points(np.array([moon_longitude]))
+        self.system = system
+        self.birth_jd = birth_jd
+        self.start_lord = system.lords[int(codes[0])]
+        self.elapsed_fraction = float(elapsed[0])
+        start = birth_jd - self.elapsed_fraction * _years_to_days(system.years[int(codes[0])])
+        self.table = DashaTable(system)
+        self.table.append_sequence(int(codes[0]), start, _years_to_days(system.total_years), 0, -1, system.rounds)
+
+    @classmethod
+    def from_birth(cls, system: DashaSystem, birth_dt_utc: datetime, moon_longitude: float) -> DashaTree:
+        return cls(system, julian_day(birth_dt_utc), moon_longitude)
+
+    @property
+    def balance_years(self) -> float:
+        """Years of the first mahadasha remaining at birth."""
+        return (1.0 - self.elapsed_fraction) * self.system.years[self.system.code(self.start_lord)]
+
+    @property
+    def mahadashas(self) -> list[DashaNode]:
+        return [DashaNode(self.table, row) for row in range(self.table.top)]
+
+    def rows_at(self, jd: float, depth: int = 2) -> list[int]:
+        """Return the table rows running at ``jd``, one per level down to ``depth`` levels.
+
+        Each level is a bisect over the starts of one sibling block.
+        """
+        rows: list[int] = []
+        first = 0
+        for level in range(min(depth, len(LEVELS))):
+            row = self.table.siblings(first).at(jd)
+            if row is None:
+                break
+            rows.append(row)
+            if level + 1 < depth:
+                first = self.table.children(row)
+        return rows
+
+    def at(self, jd: float, depth: int = 2) -> list[DashaNode]:
+        """Return the running periods at ``jd``, one per level down to ``depth`` levels."""
+        return [DashaNode(self.table, row) for row in self.rows_at(jd, depth)]
+
+    def overlapping(self, start_jd: float, end_jd: float, depth: int = 2) -> Iterator[DashaNode]:
+        """Yield periods overlapping ``[start_jd, end_jd]`` in time order, parents before children.
+
+        Only the matching slice of each level is visited, so sub-periods
+        outside the range are never generated.
+        """
+        table = self.table
+        stack = [iter(table.siblings(0).overlapping(start_jd, end_jd))]
+        while stack:
+            row = next(stack[-1], None)
+            if row is None:
+                stack.pop()
+                continue
+            yield DashaNode(table, row)
+            if table.level[row] + 1 < depth:
+                stack.append(iter(table.siblings(table.children(row)).overlapping(start_jd, end_jd)))
+
+    def walk(self, depth: int = 2) -> Iterator[DashaNode]:
+        """Yield periods depth-first in time order down to ``depth`` levels."""
+        table = self.table
+        stack = list(range(table.top - 1, -1, -1))
+        while stack:
+            row = stack.pop()
+            yield DashaNode(table, row)
+            if table.level[row] + 1 < depth:
+                first = table.children(row)
+                stack.extend(range(first + table.block - 1, first - 1, -1))
+
+
+class VimshottariDasha(DashaTree):
+    """Lazy Vimshottari tree for one birth."""
+
+    def __init__(self, birth_jd: float, moon_longitude: float) -> None:
+        super().__init__(VIMSHOTTARI, birth_jd, moon_longitude)
+
+    @classmethod
+    def from_birth(cls, birth_dt_utc: datetime, moon_longitude: float) -> VimshottariDasha:
+        return cls(julian_day(birth_dt_utc), moon_longitude)
+
+
+class DashaBatch:
+    """Maha and antar state of many births at once, using array maths only.
+
+    Per birth only the starting lord code and the JD the cycle started are
+    kept; every maha/antar boundary is the system's ``antar_offsets`` row for
+    that lord, so no period objects are built. Boundaries may differ from
+    ``DashaTree`` by float rounding well under a second.
+    """
+
+    def __init__(self, system: DashaSystem, birth_jd: np.ndarray, moon_longitudes: np.ndarray) -> None:
+        self.system = system
+        self.start_lord, self.elapsed_fraction = system.starting_points(moon_longitudes)
+        years = np.array(system.years, dtype=float)[self.start_lord]
+        self.cycle_start = np.asarray(birth_jd, dtype=float) - _years_to_days(self.elapsed_fraction * years)
+
+    def __len__(self) -> int:
+        return len(self.cycle_start)
+
+    def boundaries(self, rows: slice) -> np.ndarray:
+        """Return the JDs of all antardasha starts and the cycle end for ``rows``, one row per birth."""
+        return self.cycle_start[rows, None] + _years_to_days(self.system.antar_offsets[self.start_lord[rows]])
+
+    def at(self, jd: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return maha lord codes, antar lord codes and antar end JDs at ``jd``.
+
+        Births whose cycle does not cover ``jd`` get code -1 and NaN.
+        """
+        n, columns = len(self), self.system.antar_offsets.shape[1] - 1
+        maha = np.full(n, -1, dtype=np.int8)
+        antar = np.full(n, -1, dtype=np.int8)
+        ends = np.full(n, np.nan)
+        for lo in range(0, n, BATCH_ROWS):
+            rows = slice(lo, min(lo + BATCH_ROWS, n))
+            bounds = self.boundaries(rows)
+            col = (bounds <= jd).sum(axis=1) - 1
+            hit = np.flatnonzero((col >= 0) & (col < columns))
+            lords, cols = self.start_lord[rows][hit], col[hit]
+            maha[lo + hit] = self.system.maha_codes[lords, cols]
+            antar[lo + hit] = self.system.antar_codes[lords, cols]
+            ends[lo + hit] = bounds[hit, cols + 1]
+        return maha, antar, ends
+
+    def changes(self, start_jd: float, end_jd: float) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return antardasha starts in ``[start_jd, end_jd)`` as ``(birth rows, JDs, maha codes, antar codes)``.
+
+        Results are ordered by JD. A start whose antar lord equals its maha lord
+        is also a new mahadasha.
+        """
+        columns = self.system.antar_offsets.shape[1] - 1
+        found: list[tuple[np.ndarray, ...]] = []
+        for lo in range(0, len(self), BATCH_ROWS):
+            rows = slice(lo, min(lo + BATCH_ROWS, len(self)))
+            starts = self.boundaries(rows)[:, :columns]
+            hit_rows, cols = np.nonzero((starts >= start_jd) & (starts < end_jd))
+            lords = self.start_lord[rows][hit_rows]
+            found.append((lo + hit_rows, starts[hit_rows, cols], self.system.maha_codes[lords, cols], self.system.antar_codes[lords, cols]))
+        if not found:
+            return np.empty(0, dtype=np.int64), np.empty(0), np.empty(0, dtype=np.int8), np.empty(0, dtype=np.int8)
+        births, jds, maha, antar = (np.concatenate(parts) for parts in zip(*found))
+        order = np.argsort(jds, kind="stable")
+        return births[order], jds[order], maha[order], antar[order]
+
+
+class VimshottariBatch(DashaBatch):
+    """Vimshottari state of many births."""
+
+    def __init__(self, birth_jd: np.ndarray, moon_longitudes: np.ndarray) -> None:
+        super().__init__(VIMSHOTTARI, birth_jd, moon_longitudes)
+
+
+def build_vimshottari_periods(start_lord: str, birth_dt_utc: datetime, years: int = 120) -> list[DashaPeriod]:
+    """Build Mahadasha and Antardasha periods from a start lord, with the first period starting at birth."""
+    birth_jd = julian_day(birth_dt_utc)
+    table = DashaTable(VIMSHOTTARI)
+    table.append_sequence(LORD_CODES[start_lord], birth_jd, _years_to_days(TOTAL_YEARS), 0, -1)
+    periods: list[DashaPeriod] = []
+    for maha in range(9):
+        periods.append(table.to_model(maha))
+        first = table.children(maha)
+        periods.extend(table.to_model(row) for row in range(first, first + 9))
+        if table.end[maha] - birth_jd > _years_to_days(years):
             break
     return periods
 
 
-def current_dasha(periods: list[DashaPeriod], on_dt: datetime) -> tuple[DashaPeriod | None, DashaPeriod | None]:
-    """Return current maha and antar period for datetime."""
-    maha = next((p for p in periods if p.level == "maha" and p.start_datetime <= on_dt <= p.end_datetime), None)
-    antar = next((p for p in periods if p.level == "antar" and p.start_datetime <= on_dt <= p.end_datetime and maha and maha.id in p.parent_ids), None)
-    return maha, antar
+class DashaPeriodIndex:
+    """Per-level interval indexes over a flat list of ``DashaPeriod`` models."""
+
+    def __init__(self, periods: list[DashaPeriod]) -> None:
+        self.levels: dict[str, tuple[list[DashaPeriod], IntervalIndex]] = {}
+        for level in LEVELS:
+            rows = sorted((p for p in periods if p.level == level), key=lambda p: p.start_datetime)
+            if rows:
+                index = IntervalIndex([julian_day(p.start_datetime) for p in rows], [julian_day(p.end_datetime) for p in rows])
+                self.levels[level] = (rows, index)
+
+    def at(self, level: str, on_dt: datetime) -> DashaPeriod | None:
+        """Return the ``level`` period running at ``on_dt``."""
+        if level not in self.levels:
+            return None
+        rows, index = self.levels[level]
+        i = index.at(julian_day(on_dt))
+        return None if i is None else rows[i]
+
+    def overlapping(self, level: str, start: datetime, end: datetime) -> list[DashaPeriod]:
+        """Return the ``level`` periods overlapping ``[start, end]``."""
+        if level not in self.levels:
+            return []
+        rows, index = self.levels[level]
+        return [rows[i] for i in index.overlapping(julian_day(start), julian_day(end))]
+
+
+def current_dasha(
+    periods: list[DashaPeriod] | DashaPeriodIndex, on_dt: datetime
+) -> tuple[DashaPeriod | None, DashaPeriod | None]:
+    """Return current maha and antar period for datetime.
+
+    Callers looking up many dates should build a :class:`DashaPeriodIndex`
+    once and pass it instead of the list.
+    """
+    index = periods if isinstance(periods, DashaPeriodIndex) else DashaPeriodIndex(periods)
+    return index.at("maha", on_dt), index.at("antar", on_dt)
 
 
 def dasha_lord_from_moon_nakshatra(moon_nakshatra_index: int) -> str:
     """Map moon nakshatra index to Vimshottari starting lord."""
-    return list(cycle(DASHA_ORDER))[moon_nakshatra_index % 9]
+    return NAKSHATRA_LORDS[moon_nakshatra_index % 27]
@@ -1,16 +1,27 @@
-"""Ephemeris backend abstraction with Swiss Ephemeris and CSV fallback."""
+"""Ephemeris backend abstraction with Swiss Ephemeris, precomputed tables and tiering."""
 
 from __future__ import annotations
 
 import csv
 import logging
+from bisect import bisect_right
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from math import floor
 from pathlib import Path
+from time import perf_counter
+from typing import Sequence
+
+import numpy as np
+
+from .vedic_calculations import PLANET_NAMES, datetime_from_julian_day, julian_day, julian_days_from_datetime64
 
 LOGGER = logging.getLogger(__name__)
 
-PLANETS = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu"]
+PLANETS = PLANET_NAMES
+ORDINAL_JD_OFFSET = 1721424.5  # Julian day of proleptic ordinal 0 at 00:00 UTC
 
 
 @dataclass
@@ -21,12 +32,118 @@ class EphemerisResult:
     speed: float | None = None
 
 
+class EphemerisCoverageError(ValueError):
+    """Raised when no ephemeris source covers the requested instant."""
+
+
+@dataclass
+class EphemerisBatch:
+    """Tropical longitudes and speeds for many instants, shaped planets x times.
+
+    Speeds are NaN where the backend has none.
+    """
+
+    jd: np.ndarray
+    longitudes: np.ndarray
+    speeds: np.ndarray
+    planets: list[str]
+
+    def longitude(self, planet: str) -> np.ndarray:
+        return self.longitudes[self.planets.index(planet)]
+
+    def speed(self, planet: str) -> np.ndarray:
+        return self.speeds[self.planets.index(planet)]
+
+
+def select_planets(planets: Sequence[str] | None) -> list[str]:
+    """Validate a planet subset and return it in ``PLANETS`` order (all when None)."""
+    if planets is None:
+        return list(PLANETS)
+    unknown = set(planets) - set(PLANETS)
+    if unknown:
+        raise ValueError(f"Unknown planets: {', '.join(sorted(unknown))}")
+    return [p for p in PLANETS if p in planets]
+
+
+def node_bodies(wanted: Sequence[str]) -> list[str]:
+    """Bodies a source must compute for ``wanted``; Ketu is derived from Rahu."""
+    bodies = [p for p in wanted if p != "Ketu"]
+    if "Ketu" in wanted and "Rahu" not in bodies:
+        bodies.append("Rahu")
+    return bodies
+
+
+def ketu_from_rahu(
+    longitude: float | np.ndarray, speed: float | np.ndarray | None
+) -> tuple[float | np.ndarray, float | np.ndarray | None]:
+    """Return Ketu's longitude and speed from Rahu's, for floats or arrays alike.
+
+    Ketu is the opposite point, and its speed is reported with the opposite
+    sign of Rahu's.
+    """
+    return (longitude + 180.0) % 360.0, None if speed is None else -speed
+
+
+def julian_days(times: Sequence[datetime]) -> np.ndarray:
+    """Return UTC Julian days for a sequence of aware datetimes."""
+    return np.array([julian_day(t) for t in times], dtype=float)
+
+
 class BaseEphemerisBackend:
-    """Interface for tropical planetary positions."""
+    """Interface for tropical planetary positions.
+
+    Engine hot paths call the ``*_jd`` methods with float UTC Julian days;
+    the datetime methods are the API edge.
+    """
 
-    def get_positions(self, dt_utc: datetime) -> dict[str, EphemerisResult]:
+    def get_positions(self, dt_utc: datetime, planets: Sequence[str] | None = None) -> dict[str, EphemerisResult]:
+        """Return positions at ``dt_utc`` for ``planets`` (all when None)."""
         raise NotImplementedError
 
+    def get_positions_jd(self, jd: float, planets: Sequence[str] | None = None) -> dict[str, EphemerisResult]:
+        """Return positions at a UTC Julian day; backends with a native JD path override this."""
+        return self.get_positions(datetime_from_julian_day(jd), planets)
+
+    def date_range(self) -> tuple[date, date] | None:
+        """Return the covered date range, or None when unbounded."""
+        return None
+
+    def covers(self, dt_utc: datetime) -> bool:
+        """Return True when ``dt_utc`` can be answered by this backend."""
+        return self.covers_jd(julian_day(dt_utc))
+
+    def covers_jd(self, jd: float) -> bool:
+        """Return True when the UTC Julian day ``jd`` can be answered by this backend."""
+        return True
+
+    def coverage_mask(self, jd: np.ndarray) -> np.ndarray:
+        """Vectorized ``covers`` over UTC Julian days."""
+        return np.ones(jd.shape, dtype=bool)
+
+    def tier_stats(self) -> dict[str, int]:
+        """Return per-tier hit counters; empty for single-source backends."""
+        return {}
+
+    def get_positions_batch(self, times: Sequence[datetime] | np.ndarray, planets: Sequence[str] | None = None) -> EphemerisBatch:
+        """Return positions for many instants, given as aware datetimes or a ``datetime64`` array of UTC instants."""
+        if isinstance(times, np.ndarray) and np.issubdtype(times.dtype, np.datetime64):
+            return self.get_positions_batch_jd(julian_days_from_datetime64(times), planets)
+        return self.get_positions_batch_jd(julian_days(times), planets)
+
+    def get_positions_batch_jd(self, jd: np.ndarray, planets: Sequence[str] | None = None) -> EphemerisBatch:
+        """Return positions for an array of UTC Julian days; backends override with array paths."""
+        wanted = select_planets(planets)
+        jd = np.asarray(jd, dtype=float)
+        longitudes = np.empty((len(wanted), jd.size))
+        speeds = np.full((len(wanted), jd.size), np.nan)
+        for col, instant in enumerate(jd.tolist()):
+            positions = self.get_positions_jd(instant, wanted)
+            for row, planet in enumerate(wanted):
+                longitudes[row, col] = positions[planet].longitude
+                if positions[planet].speed is not None:
+                    speeds[row, col] = positions[planet].speed
+        return EphemerisBatch(jd=jd, longitudes=longitudes, speeds=speeds, planets=wanted)
+
 
 class SwissEphemerisBackend(BaseEphemerisBackend):
     """Use pyswisseph when installed."""
@@ -47,45 +164,410 @@ class SwissEphemerisBackend(BaseEphemerisBackend):
 
         self.swe = swe
 
-    def get_positions(self, dt_utc: datetime) -> dict[str, EphemerisResult]:
-        """Return tropical positions from Swiss Ephemeris."""
-        jd = self.swe.julday(dt_utc.year, dt_utc.month, dt_utc.day, dt_utc.hour + dt_utc.minute / 60)
+    def _keys(self, wanted: list[str]) -> list[tuple[str, int]]:
+        """Swiss bodies to compute; Ketu is derived from Rahu."""
+        return [(p, self.SWISS_MAP[p]) for p in node_bodies(wanted)]
+
+    def get_positions(self, dt_utc: datetime, planets: Sequence[str] | None = None) -> dict[str, EphemerisResult]:
+        """Return tropical positions from Swiss Ephemeris, computing only the requested bodies."""
+        return self.get_positions_jd(julian_day(dt_utc), planets)
+
+    def get_positions_jd(self, jd: float, planets: Sequence[str] | None = None) -> dict[str, EphemerisResult]:
+        wanted = select_planets(planets)
         out: dict[str, EphemerisResult] = {}
-        for planet, key in self.SWISS_MAP.items():
+        for planet, key in self._keys(wanted):
             data, _ = self.swe.calc_ut(jd, key)
             out[planet] = EphemerisResult(longitude=data[0] % 360.0, speed=data[3])
-        out["Ketu"] = EphemerisResult(longitude=(out["Rahu"].longitude + 180.0) % 360.0, speed=-out["Rahu"].speed if out["Rahu"].speed else None)
-        return out
+        if "Ketu" in wanted:
+            longitude, speed = ketu_from_rahu(out["Rahu"].longitude, out["Rahu"].speed)
+            out["Ketu"] = EphemerisResult(longitude=longitude, speed=speed)
+        return {planet: out[planet] for planet in wanted}
+
+    def get_positions_batch_jd(self, jd: np.ndarray, planets: Sequence[str] | None = None) -> EphemerisBatch:
+        """Return positions for many instants in one tight loop over the Julian days."""
+        wanted = select_planets(planets)
+        jd = np.asarray(jd, dtype=float)
+        calc_ut = self.swe.calc_ut
+        bodies = self._keys(wanted)
+        keys = [key for _, key in bodies]
+        # Time-major order lets Swiss reuse its per-instant Earth/nutation state across bodies.
+        data = np.array([[calc_ut(t, key)[0] for key in keys] for t in jd.tolist()], dtype=float).reshape(jd.size, len(keys), 6)
+        computed = {planet: (data[:, col, 0] % 360.0, data[:, col, 3]) for col, (planet, _) in enumerate(bodies)}
+        if "Ketu" in wanted:
+            computed["Ketu"] = ketu_from_rahu(*computed["Rahu"])
+        longitudes = np.array([computed[p][0] for p in wanted]).reshape(len(wanted), jd.size)
+        speeds = np.array([computed[p][1] for p in wanted]).reshape(len(wanted), jd.size)
+        return EphemerisBatch(jd=jd, longitudes=longitudes, speeds=speeds, planets=wanted)
 
 
 class CsvEphemerisBackend(BaseEphemerisBackend):
-    """Read precomputed tropical longitudes from local CSV file."""
+    """Read precomputed tropical longitudes from local CSV file.
+
+    The file is parsed once into a day-ordinal index and re-read only when its
+    modification time changes, so each lookup is a dict hit.
+
+    Rows are taken as 00:00 UTC positions. With ``interpolate=True`` the exact
+    instant is evaluated on a cubic Lagrange polynomial through the neighbouring
+    rows, and speeds (degrees/day) come from the derivative of that polynomial;
+    coverage then ends at the last row's 00:00 rather than the end of its day.
+    """
+
+    INTERPOLATION_POINTS = 4
 
-    def __init__(self, csv_path: Path) -> None:
+    def __init__(self, csv_path: Path, interpolate: bool = False) -> None:
         self.csv_path = csv_path
+        self.interpolate = interpolate
+        self.index_build_seconds = 0.0
+        self._mtime_ns: int | None = None
+        self._rows: dict[int, tuple[float, ...]] = {}
+        self._ordinals: list[int] = []
+        self._ordinal_array = np.empty(0, dtype=np.int64)
+        self._table = np.empty((0, len(PLANETS)))
 
-    def get_positions(self, dt_utc: datetime) -> dict[str, EphemerisResult]:
-        """Return nearest-day rows from CSV or deterministic fallback."""
-        date_key = dt_utc.date().isoformat()
-        rows: list[dict[str, str]] = []
+    def _ensure_index(self) -> None:
+        mtime_ns = self.csv_path.stat().st_mtime_ns
+        if mtime_ns == self._mtime_ns:
+            return
+        started = perf_counter()
+        rows: dict[int, tuple[float, ...]] = {}
         with self.csv_path.open("r", encoding="utf-8") as handle:
             reader = csv.DictReader(handle)
-            rows = list(reader)
-        selected = next((row for row in rows if row["date"] == date_key), rows[0] if rows else None)
-        if selected is None:
+            for row in reader:
+                ordinal = date.fromisoformat(row["date"]).toordinal()
+                rows[ordinal] = tuple(float(row[planet]) for planet in PLANETS)
+        self._rows = rows
+        self._ordinals = sorted(rows)
+        self._ordinal_array = np.array(self._ordinals, dtype=np.int64)
+        self._table = np.array([rows[o] for o in self._ordinals], dtype=float).reshape(len(rows), len(PLANETS))
+        self._mtime_ns = mtime_ns
+        self.index_build_seconds = perf_counter() - started
+        LOGGER.debug("Indexed %d ephemeris rows from %s in %.2f ms.", len(rows), self.csv_path, self.index_build_seconds * 1000)
+
+    def date_range(self) -> tuple[date, date]:
+        """Return the first and last dates present in the CSV."""
+        self._ensure_index()
+        if not self._ordinals:
             raise ValueError("Ephemeris CSV is empty.")
+        return date.fromordinal(self._ordinals[0]), date.fromordinal(self._ordinals[-1])
+
+    def _interpolating(self) -> bool:
+        return self.interpolate and len(self._ordinals) > 1
+
+    def covers_jd(self, jd: float) -> bool:
+        """Return True for dates with a row, or for instants between the first and last rows when interpolating."""
+        self._ensure_index()
+        if not self._ordinals:
+            return False
+        x = jd - ORDINAL_JD_OFFSET
+        if self._interpolating():
+            return self._ordinals[0] <= x <= self._ordinals[-1]
+        return floor(x) in self._rows
+
+    def coverage_mask(self, jd: np.ndarray) -> np.ndarray:
+        self._ensure_index()
+        ordinals = self._ordinal_array
+        if not ordinals.size:
+            return np.zeros(jd.shape, dtype=bool)
+        x = jd - ORDINAL_JD_OFFSET
+        if self._interpolating():
+            return (x >= ordinals[0]) & (x <= ordinals[-1])
+        day = np.floor(x).astype(np.int64)
+        pos = np.minimum(np.searchsorted(ordinals, day), ordinals.size - 1)
+        return ordinals[pos] == day
+
+    def get_positions(self, dt_utc: datetime, planets: Sequence[str] | None = None) -> dict[str, EphemerisResult]:
+        """Return the row for the date of ``dt_utc`` (or the interpolated instant)."""
+        return self.get_positions_jd(julian_day(dt_utc), planets)
+
+    def get_positions_jd(self, jd: float, planets: Sequence[str] | None = None) -> dict[str, EphemerisResult]:
+        wanted = select_planets(planets)
+        self._ensure_index()
+        if not self._ordinals:
+            raise ValueError("Ephemeris CSV is empty.")
+        x = jd - ORDINAL_JD_OFFSET
+        ordinal = floor(x)
+        if self._interpolating():
+            if self._ordinals[0] <= x <= self._ordinals[-1]:
+                return self._interpolated(x, wanted)
+            selected = None
+        else:
+            selected = self._rows.get(ordinal)
+        if selected is None:
+            first, last = self.date_range()
+            raise EphemerisCoverageError(f"{date.fromordinal(ordinal)} is not in ephemeris CSV {self.csv_path} ({first} .. {last}).")
+        return {planet: EphemerisResult(longitude=selected[PLANETS.index(planet)], speed=None) for planet in wanted}
+
+    def _interpolated(self, x: float, wanted: list[str]) -> dict[str, EphemerisResult]:
+        count = min(self.INTERPOLATION_POINTS, len(self._ordinals))
+        pos = bisect_right(self._ordinals, x)
+        first = min(max(pos - count // 2, 0), len(self._ordinals) - count)
+        xs = self._ordinals[first : first + count]
+        samples = [self._rows[o] for o in xs]
         out: dict[str, EphemerisResult] = {}
-        for planet in PLANETS:
-            out[planet] = EphemerisResult(longitude=float(selected[planet]), speed=None)
+        for planet in wanted:
+            col = PLANETS.index(planet)
+            ys = [samples[0][col]]
+            for row in samples[1:]:
+                ys.append(ys[-1] + (row[col] - ys[-1] + 180.0) % 360.0 - 180.0)
+            value, slope = _lagrange(xs, ys, x)
+            out[planet] = EphemerisResult(longitude=value % 360.0, speed=slope)
         return out
 
+    def get_positions_batch_jd(self, jd: np.ndarray, planets: Sequence[str] | None = None) -> EphemerisBatch:
+        """Return positions for many instants through vectorized row indexing."""
+        wanted = select_planets(planets)
+        cols = [PLANETS.index(p) for p in wanted]
+        self._ensure_index()
+        if not self._ordinals:
+            raise ValueError("Ephemeris CSV is empty.")
+        jd = np.asarray(jd, dtype=float)
+        x = jd - ORDINAL_JD_OFFSET
+        day = np.floor(x).astype(np.int64)
+        ordinals = self._ordinal_array
+        if not self.coverage_mask(jd).all():
+            first, last = self.date_range()
+            raise EphemerisCoverageError(f"Requested dates are not all in ephemeris CSV {self.csv_path} ({first} .. {last}).")
+        if self._interpolating():
+            lons, slopes = self._interpolated_batch(x, cols)
+            return EphemerisBatch(jd=jd, longitudes=lons.T.copy(), speeds=slopes.T.copy(), planets=wanted)
+        pos = np.minimum(np.searchsorted(ordinals, day), len(ordinals) - 1)
+        longitudes = self._table[np.ix_(pos, cols)].T.copy()
+        speeds = np.full_like(longitudes, np.nan)
+        return EphemerisBatch(jd=jd, longitudes=longitudes, speeds=speeds, planets=wanted)
+
+    def _interpolated_batch(self, x: np.ndarray, cols: list[int]) -> tuple[np.ndarray, np.ndarray]:
+        ordinals = self._ordinal_array
+        count = min(self.INTERPOLATION_POINTS, len(ordinals))
+        pos = np.searchsorted(ordinals, x, side="right")
+        first = np.clip(pos - count // 2, 0, len(ordinals) - count)
+        window = first[:, None] + np.arange(count)
+        xs = ordinals[window].astype(float)
+        ys = np.unwrap(self._table[:, cols][window], period=360.0, axis=1)
+        weights = np.ones_like(xs)
+        d_weights = np.zeros_like(xs)
+        for i in range(count):
+            for j in range(count):
+                if i == j:
+                    continue
+                denom = xs[:, i] - xs[:, j]
+                d_weights[:, i] = d_weights[:, i] * (x - xs[:, j]) / denom + weights[:, i] / denom
+                weights[:, i] *= (x - xs[:, j]) / denom
+        values = np.einsum("nc,ncp->np", weights, ys)
+        slopes = np.einsum("nc,ncp->np", d_weights, ys)
+        return values % 360.0, slopes
+
+
+def _lagrange(xs: list[int], ys: list[float], x: float) -> tuple[float, float]:
+    """Evaluate the Lagrange polynomial through (xs, ys) and its derivative at x."""
+    value = 0.0
+    slope = 0.0
+    for i, xi in enumerate(xs):
+        basis = 1.0
+        d_basis = 0.0
+        for j, xj in enumerate(xs):
+            if i == j:
+                continue
+            denom = xi - xj
+            d_basis = d_basis * (x - xj) / denom + basis / denom
+            basis *= (x - xj) / denom
+        value += ys[i] * basis
+        slope += ys[i] * d_basis
+    return value, slope
+
+
+class TieredEphemerisBackend(BaseEphemerisBackend):
+    """Answer each instant from the first source whose coverage includes it.
+
+    Sources are ordered fastest first (compiled/CSV table, Chebyshev file, Swiss
+    Ephemeris). Per-tier hit counts are kept to help size precomputed tables.
+    """
+
+    def __init__(self, tiers: list[tuple[str, BaseEphemerisBackend]]) -> None:
+        if not tiers:
+            raise EphemerisCoverageError("No ephemeris source is available.")
+        self.tiers = tiers
+        self.hits = {name: 0 for name, _ in tiers}
+
+    def _uncovered(self, what: str) -> EphemerisCoverageError:
+        ranges = []
+        for name, backend in self.tiers:
+            span = backend.date_range()
+            ranges.append(f"{name}: {span[0]} .. {span[1]}" if span else f"{name}: unbounded")
+        return EphemerisCoverageError(f"No ephemeris source covers {what} ({'; '.join(ranges)}).")
+
+    def date_range(self) -> tuple[date, date] | None:
+        spans = [backend.date_range() for _, backend in self.tiers]
+        if any(span is None for span in spans):
+            return None
+        return min(span[0] for span in spans), max(span[1] for span in spans)
+
+    def covers_jd(self, jd: float) -> bool:
+        return any(backend.covers_jd(jd) for _, backend in self.tiers)
+
+    def coverage_mask(self, jd: np.ndarray) -> np.ndarray:
+        mask = np.zeros(jd.shape, dtype=bool)
+        for _, backend in self.tiers:
+            mask |= backend.coverage_mask(jd)
+        return mask
+
+    def get_positions(self, dt_utc: datetime, planets: Sequence[str] | None = None) -> dict[str, EphemerisResult]:
+        """Return positions from the fastest covering tier."""
+        return self.get_positions_jd(julian_day(dt_utc), planets)
+
+    def get_positions_jd(self, jd: float, planets: Sequence[str] | None = None) -> dict[str, EphemerisResult]:
+        for name, backend in self.tiers:
+            if backend.covers_jd(jd):
+                self.hits[name] += 1
+                return backend.get_positions_jd(jd, planets)
+        raise self._uncovered(datetime_from_julian_day(jd).isoformat())
+
+    def get_positions_batch_jd(self, jd: np.ndarray, planets: Sequence[str] | None = None) -> EphemerisBatch:
+        """Split the instants across tiers by coverage and merge the arrays."""
+        wanted = select_planets(planets)
+        jd = np.asarray(jd, dtype=float)
+        longitudes = np.empty((len(wanted), jd.size))
+        speeds = np.full((len(wanted), jd.size), np.nan)
+        pending = np.ones(jd.shape, dtype=bool)
+        for name, backend in self.tiers:
+            if not pending.any():
+                break
+            take = pending & backend.coverage_mask(jd)
+            if not take.any():
+                continue
+            picked = np.flatnonzero(take)
+            part = backend.get_positions_batch_jd(jd[picked], wanted)
+            longitudes[:, picked] = part.longitudes
+            speeds[:, picked] = part.speeds
+            pending &= ~take
+            self.hits[name] += int(picked.size)
+        if pending.any():
+            raise self._uncovered(datetime_from_julian_day(float(jd[np.argmax(pending)])).isoformat())
+        return EphemerisBatch(jd=jd, longitudes=longitudes, speeds=speeds, planets=wanted)
+
+    def tier_stats(self) -> dict[str, int]:
+        return dict(self.hits)
+
+
+class CachedEphemerisBackend(BaseEphemerisBackend):
+    """Size-bounded LRU of sky states in front of any backend.
+
+    Instants are snapped down to ``quantum_seconds`` (e.g. 60 for one minute,
+    86400 for one day) and the wrapped backend is queried at the snapped
+    instant, so every caller in the same quantum sees the same sky. Subset
+    requests are served from a cached full state when one exists.
+    """
+
+    def __init__(self, backend: BaseEphemerisBackend, quantum_seconds: int = 60, maxsize: int = 4096) -> None:
+        if quantum_seconds <= 0:
+            raise ValueError("quantum_seconds must be positive.")
+        self.backend = backend
+        self.quantum_seconds = quantum_seconds
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._states: OrderedDict[tuple[int, tuple[str, ...]], dict[str, EphemerisResult]] = OrderedDict()
+
+    def get_positions(self, dt_utc: datetime, planets: Sequence[str] | None = None) -> dict[str, EphemerisResult]:
+        """Return the cached sky state for the quantum containing ``dt_utc``."""
+        wanted = tuple(select_planets(planets))
+        quantum = int(dt_utc.timestamp() // self.quantum_seconds)
+        for key in ((quantum, tuple(PLANETS)), (quantum, wanted)):
+            state = self._states.get(key)
+            if state is not None:
+                self.hits += 1
+                self._states.move_to_end(key)
+                return {planet: state[planet] for planet in wanted}
+        self.misses += 1
+        instant = datetime.fromtimestamp(quantum * self.quantum_seconds, tz=timezone.utc)
+        state = self.backend.get_positions(instant, list(wanted))
+        self._states[(quantum, wanted)] = state
+        if len(self._states) > self.maxsize:
+            self._states.popitem(last=False)
+        return dict(state)
+
+    def get_positions_jd(self, jd: float, planets: Sequence[str] | None = None) -> dict[str, EphemerisResult]:
+        """JD lookups are engine internals that need exact instants, so they bypass the cache."""
+        return self.backend.get_positions_jd(jd, planets)
+
+    def get_positions_batch_jd(self, jd: np.ndarray, planets: Sequence[str] | None = None) -> EphemerisBatch:
+        """Batches bypass the cache and go straight to the wrapped backend's array path."""
+        return self.backend.get_positions_batch_jd(jd, planets)
+
+    def date_range(self) -> tuple[date, date] | None:
+        return self.backend.date_range()
+
+    def covers_jd(self, jd: float) -> bool:
+        return self.backend.covers_jd(jd)
+
+    def coverage_mask(self, jd: np.ndarray) -> np.ndarray:
+        return self.backend.coverage_mask(jd)
+
+    def tier_stats(self) -> dict[str, int]:
+        """Return memory-cache hits followed by the wrapped backend's tier hits."""
+        return {"memory": self.hits, **self.backend.tier_stats()}
+
+    def cache_info(self) -> dict[str, int]:
+        """Return hit/miss counters and current size."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._states), "maxsize": self.maxsize}
+
+    def clear(self) -> None:
+        self._states.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def build_ephemeris_backend(
+    csv_path: Path,
+    interpolate: bool = False,
+    bin_path: Path | None = None,
+    chebyshev_path: Path | None = None,
+    tiers: Sequence[str] = ("binary", "chebyshev", "swiss", "csv"),
+) -> TieredEphemerisBackend:
+    """Return a tiered backend over the available sources in ``tiers`` order.
+
+    ``binary`` and ``chebyshev`` are used when their files exist, ``csv`` when
+    the CSV exists, ``table`` means the binary file if present else the CSV,
+    and ``swiss`` needs pyswisseph.
+    """
+    sources: list[tuple[str, BaseEphemerisBackend]] = []
+    for tier in tiers:
+        has_binary = bin_path is not None and bin_path.exists()
+        if tier == "binary" or (tier == "table" and has_binary):
+            if has_binary:
+                from .ephemeris_binary import BinaryEphemerisBackend
+
+                sources.append(("binary", BinaryEphemerisBackend(bin_path, interpolate=interpolate)))
+        elif tier in ("csv", "table"):
+            if csv_path.exists():
+                sources.append(("csv", CsvEphemerisBackend(csv_path=csv_path, interpolate=interpolate)))
+        elif tier == "chebyshev":
+            if chebyshev_path is not None and chebyshev_path.exists():
+                from .ephemeris_chebyshev import ChebyshevEphemerisBackend
+
+                sources.append(("chebyshev", ChebyshevEphemerisBackend(chebyshev_path)))
+        elif tier == "swiss":
+            try:
+                sources.append(("swiss", SwissEphemerisBackend()))
+                LOGGER.info("Using Swiss Ephemeris backend.")
+            except Exception as exc:  # pragma: no cover - import/runtime dependent
+                LOGGER.warning("Swiss Ephemeris unavailable (%s). Using precomputed tables only.", exc)
+        else:
+            raise ValueError(f"Unknown ephemeris tier: {tier}")
+    return TieredEphemerisBackend(sources)
+
 
-def build_ephemeris_backend(csv_path: Path) -> BaseEphemerisBackend:
-    """Return Swiss backend when available, else CSV backend."""
-    try:
-        backend = SwissEphemerisBackend()
-        LOGGER.info("Using Swiss Ephemeris backend.")
-        return backend
-    except Exception as exc:  # pragma: no cover - import/runtime dependent
-        LOGGER.warning("Swiss Ephemeris unavailable (%s). Falling back to CSV backend.", exc)
-        return CsvEphemerisBackend(csv_path=csv_path)
+@lru_cache(maxsize=None)
+def shared_ephemeris_backend(
+    csv_path: Path,
+    interpolate: bool = False,
+    bin_path: Path | None = None,
+    chebyshev_path: Path | None = None,
+    quantum_seconds: int = 60,
+    cache_size: int = 4096,
+    tiers: tuple[str, ...] = ("binary", "chebyshev", "swiss", "csv"),
+) -> CachedEphemerisBackend:
+    """Return the process-wide cached backend for this configuration, building it once."""
+    backend = build_ephemeris_backend(
+        csv_path, interpolate=interpolate, bin_path=bin_path, chebyshev_path=chebyshev_path, tiers=tiers
+    )
+    return CachedEphemerisBackend(backend, quantum_seconds=quantum_seconds, maxsize=cache_size)
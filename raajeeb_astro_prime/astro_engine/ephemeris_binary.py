@@ -0,0 +1,163 @@
+"""Compiled fixed-width binary ephemeris tables read through mmap.
+
+Layout: a 32-byte little-endian header followed by ``days x planets x 2``
+float64 values (tropical longitude, speed in degrees/day), one row per day at
+00:00 UTC in ``PLANETS`` order. Lookups index the mapped array by day offset,
+so opening the file costs nothing and pages are shared between processes.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from datetime import date, datetime, time, timedelta, timezone
+from math import floor
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+
+from .ephemeris_backend import (
+    ORDINAL_JD_OFFSET,
+    PLANETS,
+    BaseEphemerisBackend,
+    EphemerisBatch,
+    EphemerisCoverageError,
+    EphemerisResult,
+    select_planets,
+)
+from .vedic_calculations import datetime_from_julian_day, julian_day
+
+MAGIC = b"RAEPHBIN"
+VERSION = 1
+FIELDS = 2  # longitude, speed
+HEADER = struct.Struct("<8sIIqII")  # magic, version, planet count, start ordinal, day count, fields
+
+
+def write_binary_ephemeris(path: Path, start: date, table: np.ndarray) -> None:
+    """Write a ``days x planets x 2`` table with its header."""
+    days, planets, fields = table.shape
+    if planets != len(PLANETS) or fields != FIELDS:
+        raise ValueError(f"Expected table of shape (days, {len(PLANETS)}, {FIELDS}), got {table.shape}.")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as handle:
+        handle.write(HEADER.pack(MAGIC, VERSION, planets, start.toordinal(), days, fields))
+        handle.write(np.ascontiguousarray(table, dtype="<f8").tobytes())
+
+
+def compile_binary_ephemeris(backend: BaseEphemerisBackend, start: date, end: date, path: Path) -> int:
+    """Sample ``backend`` at 00:00 UTC for each day in [start, end] and write the table."""
+    days = (end - start).days + 1
+    if days <= 0:
+        raise ValueError("End date must not precede start date.")
+    table = np.empty((days, len(PLANETS), FIELDS))
+    for offset in range(days):
+        instant = datetime.combine(start + timedelta(days=offset), time(), tzinfo=timezone.utc)
+        positions = backend.get_positions(instant)
+        for col, planet in enumerate(PLANETS):
+            result = positions[planet]
+            table[offset, col, 0] = result.longitude
+            table[offset, col, 1] = np.nan if result.speed is None else result.speed
+    write_binary_ephemeris(path, start, table)
+    return days
+
+
+class BinaryEphemerisBackend(BaseEphemerisBackend):
+    """Serve positions from a compiled binary table mapped into memory.
+
+    With ``interpolate=True`` sub-day instants use cubic Hermite interpolation
+    between the two bracketing rows, using the stored speeds as tangents, so
+    coverage ends at the last row's own 00:00 instead of the end of its day.
+    """
+
+    def __init__(self, path: Path, interpolate: bool = False) -> None:
+        self.path = path
+        self.interpolate = interpolate
+        with path.open("rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, planets, start_ordinal, days, fields = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} compiled ephemeris.")
+        if planets != len(PLANETS) or fields != FIELDS:
+            raise ValueError(f"{path} has an unsupported planet/field layout ({planets}x{fields}).")
+        self.start_ordinal = start_ordinal
+        self.day_count = days
+        self.table = np.frombuffer(self._mmap, dtype="<f8", count=days * planets * fields, offset=HEADER.size).reshape(
+            days, planets, fields
+        )
+
+    def date_range(self) -> tuple[date, date]:
+        """Return the first and last dates in the table."""
+        return date.fromordinal(self.start_ordinal), date.fromordinal(self.start_ordinal + self.day_count - 1)
+
+    def covers_jd(self, jd: float) -> bool:
+        x = jd - ORDINAL_JD_OFFSET - self.start_ordinal
+        return 0 <= x <= self.day_count - 1 if self.interpolate else 0 <= x < self.day_count
+
+    def coverage_mask(self, jd: np.ndarray) -> np.ndarray:
+        x = np.asarray(jd, dtype=float) - ORDINAL_JD_OFFSET - self.start_ordinal
+        if self.interpolate:
+            return (x >= 0) & (x <= self.day_count - 1)
+        return (x >= 0) & (x < self.day_count)
+
+    def get_positions(self, dt_utc: datetime, planets: Sequence[str] | None = None) -> dict[str, EphemerisResult]:
+        """Return positions for ``dt_utc`` from the mapped table."""
+        return self.get_positions_jd(julian_day(dt_utc), planets)
+
+    def get_positions_jd(self, jd: float, planets: Sequence[str] | None = None) -> dict[str, EphemerisResult]:
+        wanted = select_planets(planets)
+        cols = [PLANETS.index(p) for p in wanted]
+        x = jd - ORDINAL_JD_OFFSET - self.start_ordinal
+        day = floor(x)
+        if not 0 <= day < self.day_count or (self.interpolate and x > self.day_count - 1):
+            first, last = self.date_range()
+            last_instant = f"{last} 00:00 UTC" if self.interpolate else str(last)
+            raise EphemerisCoverageError(
+                f"{datetime_from_julian_day(jd).isoformat()} is outside compiled ephemeris range {first} .. {last_instant}."
+            )
+        fraction = x - day
+        row = self.table[day, cols]
+        if self.interpolate and fraction > 0.0 and day + 1 < self.day_count:
+            lons, speeds = _hermite(row, self.table[day + 1, cols], fraction)
+        else:
+            lons, speeds = row[:, 0], row[:, 1]
+        return {
+            planet: EphemerisResult(longitude=lon, speed=None if speed != speed else speed)
+            for planet, lon, speed in zip(wanted, lons.tolist(), speeds.tolist())
+        }
+
+    def get_positions_batch_jd(self, jd: np.ndarray, planets: Sequence[str] | None = None) -> EphemerisBatch:
+        """Return positions for many instants by indexing the mapped table."""
+        wanted = select_planets(planets)
+        cols = np.array([PLANETS.index(p) for p in wanted], dtype=np.int64)
+        jd = np.asarray(jd, dtype=float)
+        x = jd - ORDINAL_JD_OFFSET - self.start_ordinal
+        day = np.floor(x).astype(np.int64)
+        if not self.coverage_mask(jd).all():
+            first, last = self.date_range()
+            raise EphemerisCoverageError(f"Requested instants fall outside compiled ephemeris range {first} .. {last}.")
+        rows = self.table[day[:, None], cols]
+        if self.interpolate:
+            fraction = np.where(day + 1 < self.day_count, x - day, 0.0)
+            following = self.table[np.minimum(day + 1, self.day_count - 1)[:, None], cols]
+            longitudes, speeds = _hermite(rows, following, fraction[:, None])
+        else:
+            longitudes, speeds = rows[..., 0], rows[..., 1]
+        return EphemerisBatch(jd=jd, longitudes=longitudes.T.copy(), speeds=speeds.T.copy(), planets=wanted)
+
+
+def _hermite(row0: np.ndarray, row1: np.ndarray, t: float | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Cubic Hermite longitude and speed between two daily rows at fraction ``t``."""
+    p0 = row0[..., 0]
+    p1 = p0 + (row1[..., 0] - p0 + 180.0) % 360.0 - 180.0
+    m0 = row0[..., 1]
+    m1 = row1[..., 1]
+    missing = np.isnan(m0) | np.isnan(m1)
+    chord = p1 - p0
+    m0 = np.where(missing, chord, m0)
+    m1 = np.where(missing, chord, m1)
+    t2 = t * t
+    t3 = t2 * t
+    lon = (2 * t3 - 3 * t2 + 1) * p0 + (t3 - 2 * t2 + t) * m0 + (-2 * t3 + 3 * t2) * p1 + (t3 - t2) * m1
+    speed = (6 * t2 - 6 * t) * p0 + (3 * t2 - 4 * t + 1) * m0 + (-6 * t2 + 6 * t) * p1 + (3 * t2 - 2 * t) * m1
+    return lon % 360.0, speed
@@ -0,0 +1,226 @@
+"""Chebyshev-compressed offline ephemeris, in the spirit of JPL DE files.
+
+Each body's tropical longitude is split into fixed-length segments, and every
+segment is stored as the coefficients of a Chebyshev series fitted to Swiss
+Ephemeris output at Chebyshev-Gauss nodes. Evaluation needs only NumPy, and
+speeds come from the analytic derivative of the same series.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+
+from .ephemeris_backend import (
+    ORDINAL_JD_OFFSET,
+    PLANETS,
+    BaseEphemerisBackend,
+    EphemerisBatch,
+    EphemerisCoverageError,
+    EphemerisResult,
+    SwissEphemerisBackend,
+    ketu_from_rahu,
+    node_bodies,
+    select_planets,
+)
+from .vedic_calculations import julian_day
+
+# (segment length in days, polynomial degree) per body.
+# Chosen with `astro bench chebyshev`: sub-arcsecond against Swiss, ~5 MB for 400 years.
+DEFAULT_SEGMENTS: dict[str, tuple[float, int]] = {
+    "Sun": (32.0, 10),
+    "Moon": (8.0, 12),
+    "Mercury": (16.0, 14),
+    "Venus": (32.0, 12),
+    "Mars": (32.0, 11),
+    "Jupiter": (32.0, 8),
+    "Saturn": (32.0, 8),
+    "Rahu": (32.0, 6),
+}
+FITTED_PLANETS = [p for p in PLANETS if p != "Ketu"]
+
+
+@dataclass
+class ChebyshevSeries:
+    """Per-body Chebyshev segments covering [start_jd, start_jd + len(coeffs) * segment_days)."""
+
+    start_jd: float
+    segment_days: float
+    coeffs: np.ndarray  # (segments, degree + 1)
+
+    @property
+    def end_jd(self) -> float:
+        return self.start_jd + self.coeffs.shape[0] * self.segment_days
+
+
+def _node_offsets(degree: int) -> np.ndarray:
+    """Chebyshev-Gauss nodes on [-1, 1] for a series of the given degree."""
+    k = np.arange(degree + 1)
+    return np.cos(np.pi * (k + 0.5) / (degree + 1))
+
+
+def fit_chebyshev_series(
+    swiss: SwissEphemerisBackend,
+    planet: str,
+    start_jd: float,
+    end_jd: float,
+    segment_days: float,
+    degree: int,
+) -> ChebyshevSeries:
+    """Fit one body's longitude over [start_jd, end_jd] segment by segment."""
+    segments = int(np.ceil((end_jd - start_jd) / segment_days))
+    nodes = _node_offsets(degree)
+    seg_starts = start_jd + segment_days * np.arange(segments)
+    sample_jd = seg_starts[:, None] + (nodes[None, :] + 1.0) * (segment_days / 2.0)
+    key = swiss.SWISS_MAP[planet]
+    calc_ut = swiss.swe.calc_ut
+    samples = np.array([calc_ut(jd, key)[0][0] for jd in sample_jd.ravel()]).reshape(sample_jd.shape)
+    samples = np.unwrap(samples, period=360.0, axis=1)
+    basis = np.cos(np.outer(np.arange(degree + 1), np.arccos(nodes)))  # T_j(x_k)
+    coeffs = samples @ basis.T * (2.0 / (degree + 1))
+    coeffs[:, 0] /= 2.0
+    return ChebyshevSeries(start_jd=start_jd, segment_days=segment_days, coeffs=coeffs)
+
+
+def fit_chebyshev_ephemeris(
+    start_jd: float,
+    end_jd: float,
+    segments: dict[str, tuple[float, int]] | None = None,
+    swiss: SwissEphemerisBackend | None = None,
+) -> dict[str, ChebyshevSeries]:
+    """Fit every body in ``FITTED_PLANETS`` against Swiss Ephemeris."""
+    swiss = swiss or SwissEphemerisBackend()
+    spec = {**DEFAULT_SEGMENTS, **(segments or {})}
+    return {
+        planet: fit_chebyshev_series(swiss, planet, start_jd, end_jd, *spec[planet]) for planet in FITTED_PLANETS
+    }
+
+
+def evaluate_series(series: ChebyshevSeries, jd: np.ndarray | float) -> tuple[np.ndarray, np.ndarray]:
+    """Return unwrapped longitude and speed (degrees/day) of one body at ``jd``."""
+    offset = (np.asarray(jd, dtype=float) - series.start_jd) / series.segment_days
+    index = np.clip(offset.astype(np.int64), 0, series.coeffs.shape[0] - 1)
+    tau = 2.0 * (offset - index) - 1.0
+    return _clenshaw(series.coeffs[index], tau, 2.0 / series.segment_days)
+
+
+def save_chebyshev_ephemeris(path: Path, series: dict[str, ChebyshevSeries]) -> None:
+    """Write fitted series to an ``.npz`` archive."""
+    arrays: dict[str, np.ndarray] = {}
+    for planet, item in series.items():
+        arrays[f"{planet}.coeffs"] = item.coeffs
+        arrays[f"{planet}.meta"] = np.array([item.start_jd, item.segment_days])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as handle:
+        np.savez(handle, **arrays)
+
+
+def load_chebyshev_ephemeris(path: Path) -> dict[str, ChebyshevSeries]:
+    """Read series written by ``save_chebyshev_ephemeris``."""
+    with np.load(path) as archive:
+        series: dict[str, ChebyshevSeries] = {}
+        for planet in FITTED_PLANETS:
+            start_jd, segment_days = archive[f"{planet}.meta"].tolist()
+            series[planet] = ChebyshevSeries(start_jd, segment_days, archive[f"{planet}.coeffs"])
+    return series
+
+
+class ChebyshevEphemerisBackend(BaseEphemerisBackend):
+    """Evaluate fitted Chebyshev segments for positions and analytic speeds."""
+
+    def __init__(self, source: Path | dict[str, ChebyshevSeries]) -> None:
+        series = load_chebyshev_ephemeris(source) if isinstance(source, Path) else source
+        self.series = series
+        self.start_jd = max(item.start_jd for item in series.values())
+        self.end_jd = min(item.end_jd for item in series.values())
+        width = max(item.coeffs.shape[1] for item in series.values())
+        padded = [np.pad(series[p].coeffs, ((0, 0), (0, width - series[p].coeffs.shape[1]))) for p in FITTED_PLANETS]
+        counts = np.array([rows.shape[0] for rows in padded])
+        self._coeffs = np.concatenate(padded)
+        self._bases = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        self._last = counts - 1
+        self._starts = np.array([series[p].start_jd for p in FITTED_PLANETS])
+        self._spans = np.array([series[p].segment_days for p in FITTED_PLANETS])
+
+    def date_range(self) -> tuple[date, date]:
+        """Return the whole days inside the fitted span."""
+        first = int(np.ceil(self.start_jd - ORDINAL_JD_OFFSET))
+        last = int(np.floor(self.end_jd - ORDINAL_JD_OFFSET)) - 1
+        return date.fromordinal(first), date.fromordinal(last)
+
+    def covers_jd(self, jd: float) -> bool:
+        return self.start_jd <= jd <= self.end_jd
+
+    def coverage_mask(self, jd: np.ndarray) -> np.ndarray:
+        return (jd >= self.start_jd) & (jd <= self.end_jd)
+
+    def _evaluate(self, jd: float, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if not self.start_jd <= jd <= self.end_jd:
+            raise EphemerisCoverageError(f"JD {jd:.2f} is outside Chebyshev coverage {self.start_jd:.2f} .. {self.end_jd:.2f}.")
+        spans = self._spans[rows]
+        offset = (jd - self._starts[rows]) / spans
+        index = np.minimum(offset.astype(np.int64), self._last[rows])
+        tau = 2.0 * (offset - index) - 1.0
+        return _clenshaw(self._coeffs[self._bases[rows] + index], tau, 2.0 / spans)
+
+    def get_positions(self, dt_utc: datetime, planets: Sequence[str] | None = None) -> dict[str, EphemerisResult]:
+        """Return positions and speeds (degrees/day) at ``dt_utc``, evaluating only the requested bodies."""
+        return self.get_positions_jd(julian_day(dt_utc), planets)
+
+    def get_positions_jd(self, jd: float, planets: Sequence[str] | None = None) -> dict[str, EphemerisResult]:
+        wanted = select_planets(planets)
+        bodies = node_bodies(wanted)
+        rows = np.array([FITTED_PLANETS.index(p) for p in bodies], dtype=np.int64)
+        lons, speeds = self._evaluate(jd, rows)
+        out = {
+            planet: EphemerisResult(longitude=lon, speed=speed)
+            for planet, lon, speed in zip(bodies, (lons % 360.0).tolist(), speeds.tolist())
+        }
+        if "Ketu" in wanted:
+            longitude, speed = ketu_from_rahu(out["Rahu"].longitude, out["Rahu"].speed)
+            out["Ketu"] = EphemerisResult(longitude=longitude, speed=speed)
+        return {planet: out[planet] for planet in wanted}
+
+    def get_positions_batch_jd(self, jd: np.ndarray, planets: Sequence[str] | None = None) -> EphemerisBatch:
+        """Return positions and speeds for many instants, one vectorized pass per requested body."""
+        wanted = select_planets(planets)
+        jd = np.asarray(jd, dtype=float)
+        if jd.size and (jd.min() < self.start_jd or jd.max() > self.end_jd):
+            raise EphemerisCoverageError(f"Requested instants fall outside Chebyshev coverage {self.start_jd:.2f} .. {self.end_jd:.2f}.")
+        computed: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        for planet in node_bodies(wanted):
+            lons, slopes = evaluate_series(self.series[planet], jd)
+            computed[planet] = (lons % 360.0, slopes)
+        if "Ketu" in wanted:
+            computed["Ketu"] = ketu_from_rahu(*computed["Rahu"])
+        longitudes = np.array([computed[p][0] for p in wanted]).reshape(len(wanted), jd.size)
+        speeds = np.array([computed[p][1] for p in wanted]).reshape(len(wanted), jd.size)
+        return EphemerisBatch(jd=jd, longitudes=longitudes, speeds=speeds, planets=wanted)
+
+
+def _clenshaw(coeffs: np.ndarray, tau: np.ndarray, scale: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Evaluate Chebyshev series (rows of ``coeffs``) and their derivatives at ``tau``.
+
+    Uses the simultaneous recurrence for T_n and T_n' so value and slope come
+    out of one pass; ``scale`` converts d/dtau into d/dday.
+    """
+    degree = coeffs.shape[-1] - 1
+    t_prev = np.ones_like(tau)
+    t_curr = tau
+    d_prev = np.zeros_like(tau)
+    d_curr = np.ones_like(tau)
+    value = coeffs[..., 0] * t_prev + coeffs[..., 1] * t_curr if degree >= 1 else coeffs[..., 0] * t_prev
+    slope = coeffs[..., 1] * d_curr if degree >= 1 else np.zeros_like(tau)
+    two_tau = 2.0 * tau
+    for n in range(2, degree + 1):
+        t_next = two_tau * t_curr - t_prev
+        d_next = 2.0 * t_curr + two_tau * d_curr - d_prev
+        value = value + coeffs[..., n] * t_next
+        slope = slope + coeffs[..., n] * d_next
+        t_prev, t_curr = t_curr, t_next
+        d_prev, d_curr = d_curr, d_next
+    return value, slope * scale
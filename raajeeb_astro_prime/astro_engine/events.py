@@ -0,0 +1,392 @@
+"""Event search over ephemeris backends: ingresses and retrograde stations.
+
+A coarse grid is sampled with the batch API, each step is split at any speed
+zero crossing (station) so the longitude is monotonic inside every piece, and
+each boundary the piece crosses is then located with Brent's method. Cost
+therefore scales with the number of events, not with the time resolution.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import lru_cache
+from math import floor
+from typing import Callable
+
+import numpy as np
+
+from .ascendant import ascendant_longitudes
+from .ayanamsa import shared_ayanamsa_provider
+from .ephemeris_backend import BaseEphemerisBackend
+from .vedic_calculations import J2000_UTC, NAKSHATRAS, SIGNS, datetime_from_julian_day, julian_day
+
+BOUNDARY_WIDTHS = {"sign": 30.0, "nakshatra": 360.0 / 27, "pada": 360.0 / 108}
+
+# Grid step in days; short enough that no step holds more than one station.
+SCAN_STEP_DAYS = {
+    "Sun": 5.0,
+    "Moon": 1.0,
+    "Mercury": 2.0,
+    "Venus": 4.0,
+    "Mars": 4.0,
+    "Jupiter": 5.0,
+    "Saturn": 5.0,
+    "Rahu": 5.0,
+    "Ketu": 5.0,
+}
+
+TOLERANCE_DAYS = 1.0 / 86400  # one second
+
+
+@dataclass(frozen=True)
+class Ingress:
+    """One boundary crossing of a planet's sidereal longitude."""
+
+    planet: str
+    kind: str
+    jd: float
+    from_index: int
+    to_index: int
+    retrograde: bool
+
+    @property
+    def instant(self) -> datetime:
+        return datetime_from_julian_day(self.jd)
+
+    def label(self, index: int) -> str:
+        """Return the sign, nakshatra or nakshatra-pada name for a segment index."""
+        if self.kind == "sign":
+            return SIGNS[index]
+        if self.kind == "nakshatra":
+            return NAKSHATRAS[index]
+        return f"{NAKSHATRAS[index // 4]} pada {index % 4 + 1}"
+
+
+def brent_root(f: Callable[[float], float], a: float, b: float, fa: float, fb: float, tol: float = TOLERANCE_DAYS) -> float:
+    """Find a root of ``f`` in [a, b] given a sign change, using Brent's method."""
+    if fa == 0.0:
+        return a
+    if fb == 0.0:
+        return b
+    if fa * fb > 0.0:
+        raise ValueError("Root is not bracketed.")
+    if abs(fa) < abs(fb):
+        a, b, fa, fb = b, a, fb, fa
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(100):
+        if fb * fc > 0.0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol1 = 2.0 * np.finfo(float).eps * abs(b) + 0.5 * tol
+        xm = 0.5 * (c - b)
+        if abs(xm) <= tol1 or fb == 0.0:
+            return b
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                p = 2.0 * xm * s
+                q = 1.0 - s
+            else:
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * xm * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0.0:
+                q = -q
+            p = abs(p)
+            if 2.0 * p < min(3.0 * xm * q - abs(tol1 * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = xm
+        else:
+            d = e = xm
+        a, fa = b, fb
+        b += d if abs(d) > tol1 else (tol1 if xm > 0 else -tol1)
+        fb = f(b)
+    return b
+
+
+class SiderealTrack:
+    """Sidereal longitude and speed of one planet, evaluated on demand."""
+
+    FINITE_DIFFERENCE_DAYS = 1.0 / 24
+
+    def __init__(self, backend: BaseEphemerisBackend, planet: str) -> None:
+        self.backend = backend
+        self.planet = planet
+        self.ayanamsa = shared_ayanamsa_provider()
+
+    def sample(self, jd: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return sidereal longitudes and speeds (degrees/day) on a grid."""
+        batch = self.backend.get_positions_batch_jd(jd, [self.planet])
+        longitudes = (batch.longitudes[0] - self.ayanamsa.batch(jd)) % 360.0
+        speeds = batch.speeds[0]
+        if np.isnan(speeds).any() and jd.size > 1:
+            speeds = np.where(np.isnan(speeds), np.gradient(np.unwrap(longitudes, period=360.0), jd), speeds)
+        return longitudes, speeds
+
+    def longitude(self, jd: float) -> float:
+        tropical = self.backend.get_positions_jd(jd, [self.planet])[self.planet].longitude
+        return (tropical - self.ayanamsa.at_jd(jd)) % 360.0
+
+    def speed(self, jd: float) -> float:
+        result = self.backend.get_positions_jd(jd, [self.planet])[self.planet]
+        if result.speed is not None and result.speed == result.speed:
+            return result.speed
+        h = self.FINITE_DIFFERENCE_DAYS
+        return ((self.longitude(jd + h) - self.longitude(jd - h) + 180.0) % 360.0 - 180.0) / (2 * h)
+
+
+def monotonic_pieces(track: SiderealTrack, start_jd: float, end_jd: float, step: float) -> list[tuple[float, float, float, float]]:
+    """Split [start_jd, end_jd] into pieces with no station inside.
+
+    Returns ``(a, b, lon_a, lon_b)`` tuples where ``lon_b`` is unwrapped
+    relative to ``lon_a``.
+    """
+    count = max(int(np.ceil((end_jd - start_jd) / step)), 1)
+    grid = np.linspace(start_jd, end_jd, count + 1)
+    longitudes, speeds = track.sample(grid)
+    pieces: list[tuple[float, float, float, float]] = []
+    for i in range(count):
+        a, b = float(grid[i]), float(grid[i + 1])
+        lon_a, lon_b = float(longitudes[i]), float(longitudes[i + 1])
+        sa, sb = float(speeds[i]), float(speeds[i + 1])
+        if sa * sb < 0.0:
+            station = brent_root(track.speed, a, b, sa, sb)
+            lon_s = track.longitude(station)
+            lon_s = lon_a + (lon_s - lon_a + 180.0) % 360.0 - 180.0
+            pieces.append((a, station, lon_a, lon_s))
+            pieces.append((station, b, lon_s, lon_s + (lon_b - lon_s + 180.0) % 360.0 - 180.0))
+        else:
+            pieces.append((a, b, lon_a, lon_a + (lon_b - lon_a + 180.0) % 360.0 - 180.0))
+    return pieces
+
+
+def _crossings(track: SiderealTrack, kind: str, piece: tuple[float, float, float, float]) -> list[Ingress]:
+    a, b, lon_a, lon_b = piece
+    width = BOUNDARY_WIDTHS[kind]
+    segments = round(360.0 / width)
+    forward = lon_b > lon_a
+    low, high = (lon_a, lon_b) if forward else (lon_b, lon_a)
+    found: list[Ingress] = []
+    ks = range(floor(low / width) + 1, floor(high / width) + 1)
+    for k in ks if forward else reversed(ks):
+        boundary = k * width
+
+        def offset(jd: float) -> float:
+            return lon_a + (track.longitude(jd) - lon_a + 180.0) % 360.0 - 180.0 - boundary
+
+        jd = brent_root(offset, a, b, lon_a - boundary, lon_b - boundary)
+        before, after = (k - 1) % segments, k % segments
+        found.append(
+            Ingress(
+                planet=track.planet,
+                kind=kind,
+                jd=jd,
+                from_index=before if forward else after,
+                to_index=after if forward else before,
+                retrograde=not forward,
+            )
+        )
+    return found
+
+
+@dataclass
+class _IngressTable:
+    start_jd: float
+    end_jd: float
+    events: list[Ingress]
+    jds: list[float]
+
+
+class IngressFinder:
+    """Find and cache sign, nakshatra and pada ingresses for one backend.
+
+    Each computed range is kept as a table per (planet, kind); later queries
+    inside a cached range are answered by bisecting that table.
+    """
+
+    def __init__(self, backend: BaseEphemerisBackend) -> None:
+        self.backend = backend
+        self._tables: dict[tuple[str, str], list[_IngressTable]] = {}
+
+    def find(self, planet: str, kind: str, start: datetime, end: datetime) -> list[Ingress]:
+        """Return ingresses of ``planet`` across ``kind`` boundaries in [start, end]."""
+        if kind not in BOUNDARY_WIDTHS:
+            raise ValueError(f"Unknown ingress kind: {kind} (expected one of {', '.join(BOUNDARY_WIDTHS)})")
+        start_jd, end_jd = julian_day(start), julian_day(end)
+        if end_jd <= start_jd:
+            return []
+        tables = self._tables.setdefault((planet, kind), [])
+        for table in tables:
+            if table.start_jd <= start_jd and end_jd <= table.end_jd:
+                return table.events[bisect_left(table.jds, start_jd) : bisect_right(table.jds, end_jd)]
+        track = SiderealTrack(self.backend, planet)
+        events: list[Ingress] = []
+        for piece in monotonic_pieces(track, start_jd, end_jd, SCAN_STEP_DAYS.get(planet, 1.0)):
+            events.extend(_crossings(track, kind, piece))
+        tables.append(_IngressTable(start_jd, end_jd, events, [e.jd for e in events]))
+        return list(events)
+
+
+@lru_cache(maxsize=None)
+def shared_ingress_finder(backend: BaseEphemerisBackend) -> IngressFinder:
+    """Return the process-wide ingress finder for ``backend``."""
+    return IngressFinder(backend)
+
+
+NEVER_STATIONARY = {"Sun", "Moon"}
+STATIONARY_PLANETS = ("Mercury", "Venus", "Mars", "Jupiter", "Saturn")  # the bodies that turn retrograde
+
+
+@dataclass(frozen=True)
+class Station:
+    """Instant where a planet's longitudinal speed crosses zero."""
+
+    planet: str
+    jd: float
+    direction: str  # "retrograde" when turning backwards, "direct" when resuming
+    sidereal_longitude: float
+
+    @property
+    def instant(self) -> datetime:
+        return datetime_from_julian_day(self.jd)
+
+
+def find_stations(backend: BaseEphemerisBackend, planet: str, start_jd: float, end_jd: float) -> list[Station]:
+    """Locate speed zero crossings of ``planet`` in [start_jd, end_jd] by Brent's method."""
+    if planet in NEVER_STATIONARY or end_jd <= start_jd:
+        return []
+    track = SiderealTrack(backend, planet)
+    step = SCAN_STEP_DAYS.get(planet, 1.0)
+    count = max(int(np.ceil((end_jd - start_jd) / step)), 1)
+    grid = np.linspace(start_jd, end_jd, count + 1)
+    _, speeds = track.sample(grid)
+    found: list[Station] = []
+    for i in np.flatnonzero(speeds[:-1] * speeds[1:] < 0.0).tolist():
+        sa, sb = float(speeds[i]), float(speeds[i + 1])
+        jd = brent_root(track.speed, float(grid[i]), float(grid[i + 1]), sa, sb)
+        found.append(Station(planet, jd, "retrograde" if sa > 0.0 else "direct", track.longitude(jd)))
+    return found
+
+
+class StationFinder:
+    """Stationary-retrograde and stationary-direct instants, cached per planet and year."""
+
+    def __init__(self, backend: BaseEphemerisBackend) -> None:
+        self.backend = backend
+        self._years: dict[tuple[str, int], list[Station]] = {}
+
+    def _year(self, planet: str, year: int) -> list[Station]:
+        key = (planet, year)
+        if key not in self._years:
+            start = julian_day(datetime(year, 1, 1, tzinfo=J2000_UTC.tzinfo))
+            end = julian_day(datetime(year + 1, 1, 1, tzinfo=J2000_UTC.tzinfo))
+            self._years[key] = find_stations(self.backend, planet, start, end)
+        return self._years[key]
+
+    def find(self, planet: str, start: datetime, end: datetime) -> list[Station]:
+        """Return stations of ``planet`` between ``start`` and ``end``."""
+        start_jd, end_jd = julian_day(start), julian_day(end)
+        out: list[Station] = []
+        for year in range(start.year, end.year + 1):
+            out.extend(s for s in self._year(planet, year) if start_jd <= s.jd <= end_jd)
+        return out
+
+
+@lru_cache(maxsize=None)
+def shared_station_finder(backend: BaseEphemerisBackend) -> StationFinder:
+    """Return the process-wide station finder for ``backend``."""
+    return StationFinder(backend)
+
+
+# Near the polar circles a sign can rise in ~3 minutes, so one step may cross
+# several boundaries; each is solved separately. The scan only assumes the
+# ascendant keeps moving forward and advances well under 180 degrees per step
+# (at most ~85 at 66 degrees latitude) so unwrapping stays unambiguous.
+LAGNA_SCAN_MINUTES = 10
+LAGNA_MAX_LATITUDE = 66.0
+
+
+@dataclass
+class _LagnaDay:
+    start_index: int
+    events: list[Ingress]
+    jds: list[float]
+
+
+class LagnaIngressFinder:
+    """Rising-sign changes per place and UTC day.
+
+    Each day is sampled on a coarse grid and the sign boundaries are then
+    located with Brent's method. Days are cached under the location rounded to
+    ``places`` decimals, so rising-sign lookups become a bisect.
+    """
+
+    def __init__(self, places: int = 2, maxsize: int = 1024) -> None:
+        self.places = places
+        self.maxsize = maxsize
+        self.ayanamsa = shared_ayanamsa_provider()
+        self._days: OrderedDict[tuple[float, float, int], _LagnaDay] = OrderedDict()
+
+    def _sidereal(self, jd: float, latitude: float, longitude: float) -> float:
+        return (float(ascendant_longitudes(jd, latitude, longitude)) - self.ayanamsa.at_jd(jd)) % 360.0
+
+    def _day(self, latitude: float, longitude: float, day: date) -> _LagnaDay:
+        if abs(latitude) > LAGNA_MAX_LATITUDE:
+            raise ValueError(f"Lagna tables are not supported beyond {LAGNA_MAX_LATITUDE} degrees latitude.")
+        key = (round(latitude, self.places), round(longitude, self.places), day.toordinal())
+        cached = self._days.get(key)
+        if cached is not None:
+            self._days.move_to_end(key)
+            return cached
+        lat, lon = key[0], key[1]
+        start_jd = julian_day(datetime(day.year, day.month, day.day, tzinfo=J2000_UTC.tzinfo))
+        grid = start_jd + np.arange(0, 24 * 60 + 1, LAGNA_SCAN_MINUTES) / 1440.0
+        lons = np.unwrap((ascendant_longitudes(grid, lat, lon) - self.ayanamsa.batch(grid)) % 360.0, period=360.0)
+        events: list[Ingress] = []
+        for i in np.flatnonzero(np.floor(lons[1:] / 30.0) != np.floor(lons[:-1] / 30.0)).tolist():
+            lon_a, lon_b = float(lons[i]), float(lons[i + 1])
+            for k in range(floor(lon_a / 30.0) + 1, floor(lon_b / 30.0) + 1):
+                boundary = k * 30.0
+
+                def offset(jd: float) -> float:
+                    return lon_a + (self._sidereal(jd, lat, lon) - lon_a + 180.0) % 360.0 - 180.0 - boundary
+
+                jd = brent_root(offset, float(grid[i]), float(grid[i + 1]), lon_a - boundary, lon_b - boundary)
+                events.append(Ingress("Lagna", "sign", jd, (k - 1) % 12, k % 12, False))
+        table = _LagnaDay(int(lons[0] // 30.0) % 12, events, [e.jd for e in events])
+        self._days[key] = table
+        if len(self._days) > self.maxsize:
+            self._days.popitem(last=False)
+        return table
+
+    def changes(self, latitude: float, longitude: float, day: date) -> list[Ingress]:
+        """Return the rising-sign changes during the UTC day ``day`` at a place."""
+        return list(self._day(latitude, longitude, day).events)
+
+    def rising_sign(self, latitude: float, longitude: float, dt_utc: datetime) -> str:
+        """Return the sidereal sign rising at ``dt_utc`` from the cached day table.
+
+        Naive datetimes are taken as UTC, as :func:`julian_day` does; aware ones
+        are converted so the table of the right UTC day is used.
+        """
+        if dt_utc.tzinfo is None:
+            dt_utc = dt_utc.replace(tzinfo=J2000_UTC.tzinfo)
+        dt_utc = dt_utc.astimezone(J2000_UTC.tzinfo)
+        table = self._day(latitude, longitude, dt_utc.date())
+        i = bisect_right(table.jds, julian_day(dt_utc))
+        return SIGNS[table.events[i - 1].to_index if i else table.start_index]
+
+
+@lru_cache(maxsize=None)
+def shared_lagna_finder() -> LagnaIngressFinder:
+    """Return the process-wide lagna ingress finder."""
+    return LagnaIngressFinder()
@@ -0,0 +1,39 @@
+"""Bisect-based lookup over sorted, non-overlapping half-open intervals."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Optional, Sequence
+
+
+class IntervalIndex:
+    """Point and range queries over intervals ``[starts[i], ends[i])`` sorted by start.
+
+    Both queries cost O(log n); range queries return a slice, so callers only
+    touch the intervals that actually match. ``lo``/``hi`` restrict the index
+    to a window of shared columns without copying them; returned indices are
+    positions in the full columns.
+    """
+
+    __slots__ = ("starts", "ends", "lo", "hi")
+
+    def __init__(self, starts: Sequence[float], ends: Sequence[float], lo: int = 0, hi: Optional[int] = None) -> None:
+        self.starts = starts
+        self.ends = ends
+        self.lo = lo
+        self.hi = len(starts) if hi is None else hi
+
+    def __len__(self) -> int:
+        return self.hi - self.lo
+
+    def at(self, x: float) -> int | None:
+        """Return the index of the interval containing ``x``, or None."""
+        i = bisect_right(self.starts, x, self.lo, self.hi) - 1
+        if i >= self.lo and x < self.ends[i]:
+            return i
+        return None
+
+    def overlapping(self, start: float, end: float) -> range:
+        """Return the indices of intervals that overlap ``[start, end]``."""
+        lo = bisect_right(self.ends, start, self.lo, self.hi)  # ends are sorted too, since intervals do not overlap
+        return range(lo, max(lo, bisect_right(self.starts, end, self.lo, self.hi)))
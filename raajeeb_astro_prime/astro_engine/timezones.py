@@ -0,0 +1,120 @@
+"""Local-to-UTC conversion with cached zones and array lookups over offset transitions."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+# Span scanned for offset transitions, in UTC epoch seconds (1850-01-01 .. 2150-01-01).
+TABLE_START = int(datetime(1850, 1, 1, tzinfo=timezone.utc).timestamp())
+TABLE_END = int(datetime(2150, 1, 1, tzinfo=timezone.utc).timestamp())
+SCAN_STEP_SECONDS = 86400  # transitions less than a day apart are not expected
+
+OK, AMBIGUOUS, NONEXISTENT = 0, 1, 2
+
+
+class AmbiguousLocalTimeError(ValueError):
+    """Local wall time occurs twice because clocks were turned back."""
+
+
+class NonexistentLocalTimeError(ValueError):
+    """Local wall time was skipped because clocks were turned forward."""
+
+
+@lru_cache(maxsize=None)
+def get_zone(name: str) -> ZoneInfo:
+    """Return a cached ``ZoneInfo`` for an IANA zone name."""
+    return ZoneInfo(name)
+
+
+def _offset(zone: ZoneInfo, epoch: int) -> int:
+    return int(datetime.fromtimestamp(epoch, zone).utcoffset().total_seconds())
+
+
+@dataclass(frozen=True)
+class OffsetTable:
+    """UTC offset transitions of one zone.
+
+    ``offsets[0]`` applies before ``transitions[0]``; ``offsets[i + 1]`` applies
+    from ``transitions[i]`` (UTC epoch seconds) onwards.
+    """
+
+    transitions: np.ndarray
+    offsets: np.ndarray
+
+    @property
+    def window_start(self) -> np.ndarray:
+        """Earliest local wall time affected by each transition."""
+        return self.transitions + np.minimum(self.offsets[:-1], self.offsets[1:])
+
+    @property
+    def window_end(self) -> np.ndarray:
+        """Local wall time at which each transition stops being ambiguous or skipped."""
+        return self.transitions + np.maximum(self.offsets[:-1], self.offsets[1:])
+
+
+@lru_cache(maxsize=None)
+def offset_table(name: str) -> OffsetTable:
+    """Build the offset-transition table of a zone by sampling and bisecting ``utcoffset``."""
+    zone = get_zone(name)
+    transitions: list[int] = []
+    offsets = [_offset(zone, TABLE_START)]
+    previous = TABLE_START
+    for epoch in range(TABLE_START + SCAN_STEP_SECONDS, TABLE_END + 1, SCAN_STEP_SECONDS):
+        current = _offset(zone, epoch)
+        if current != offsets[-1]:
+            low, high = previous, epoch  # offset at low is the old one, at high the new one
+            while high - low > 1:
+                mid = (low + high) // 2
+                if _offset(zone, mid) == current:
+                    high = mid
+                else:
+                    low = mid
+            transitions.append(high)
+            offsets.append(current)
+        previous = epoch
+    return OffsetTable(np.array(transitions, dtype=np.int64), np.array(offsets, dtype=np.int64))
+
+
+def local_to_utc_batch(local: np.ndarray, zone_name: str) -> tuple[np.ndarray, np.ndarray]:
+    """Convert naive local wall times to UTC in one array pass.
+
+    ``local`` is a ``datetime64`` array. Returns UTC ``datetime64[s]`` values and
+    a status array (``OK``, ``AMBIGUOUS`` or ``NONEXISTENT``). Flagged entries
+    are resolved as ``fold=0`` would resolve them, using the pre-transition
+    offset, so callers can decide whether to accept or reject them.
+    """
+    table = offset_table(zone_name)
+    wall = np.asarray(local, dtype="datetime64[s]").astype(np.int64)
+    starts, ends = table.window_start, table.window_end
+    i = np.searchsorted(starts, wall, side="right") - 1
+    inside = (i >= 0) & (wall < ends[np.maximum(i, 0)])
+    offset = np.where(inside, table.offsets[np.maximum(i, 0)], table.offsets[i + 1])
+    forward = table.offsets[1:] > table.offsets[:-1]
+    status = np.where(inside, np.where(forward[np.maximum(i, 0)], NONEXISTENT, AMBIGUOUS), OK).astype(np.int8)
+    return (wall - offset).astype("datetime64[s]"), status
+
+
+def local_to_utc(local: datetime, zone_name: str, fold: Optional[int] = None) -> datetime:
+    """Convert a naive local wall time to an aware UTC datetime.
+
+    Nonexistent times always raise. Ambiguous times raise unless ``fold``
+    chooses the first (0) or second (1) occurrence.
+    """
+    zone = get_zone(zone_name)
+    first = local.replace(tzinfo=zone, fold=0)
+    second = local.replace(tzinfo=zone, fold=1)
+    if first.utcoffset() != second.utcoffset():
+        if first.astimezone(timezone.utc).astimezone(zone).replace(tzinfo=None) != local:
+            raise NonexistentLocalTimeError(f"{local.isoformat()} does not exist in {zone_name} (clocks moved forward).")
+        if fold is None:
+            raise AmbiguousLocalTimeError(
+                f"{local.isoformat()} occurs twice in {zone_name}; choose fold 0 (first) or 1 (second)."
+            )
+        return (second if fold else first).astimezone(timezone.utc)
+    return first.astimezone(timezone.utc)
@@ -2,10 +2,38 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
+from typing import Iterator, Optional, Sequence
+
+import numpy as np
 
 from raajeeb_astro_prime.models.astro_core import Chart, TransitPosition, TransitSnapshot
-from .vedic_calculations import house_from_lagna, sign_from_longitude
+from .ayanamsa import shared_ayanamsa_provider
+from .ephemeris_backend import BaseEphemerisBackend
+from .events import IngressFinder
+from .vedic_calculations import (
+    HOUSE_TABLE,
+    SIGN_INDEX,
+    SIGNS,
+    datetime_from_julian_day,
+    houses_from_lagna,
+    sign_index,
+    sign_indices,
+)
+
+SADE_SATI_HOUSES = (12, 1, 2)
+JUPITER_TRINE_HOUSES = (1, 5, 9)
+
+
+def transit_highlight(planet: str, house_from_lagna: int, house_from_moon: int) -> Optional[str]:
+    """Return the highlight text for one transiting planet, if any."""
+    if planet == "Saturn" and house_from_moon in SADE_SATI_HOUSES:
+        return "Saturn is in Sade Sati zone from natal Moon (12/1/2 houses)."
+    if planet == "Jupiter" and house_from_lagna in JUPITER_TRINE_HOUSES:
+        return "Jupiter transit activates trinal houses from Lagna (1/5/9)."
+    return None
 
 
 def compute_transit_snapshot(
@@ -14,25 +42,123 @@ def compute_transit_snapshot(
     transit_date: datetime,
 ) -> TransitSnapshot:
     """Compute transit houses from natal Lagna and Moon."""
-    moon_sign = chart.moon_sign
+    lagna_idx = SIGN_INDEX[chart.lagna_sign]
+    moon_idx = SIGN_INDEX[chart.moon_sign]
     positions: list[TransitPosition] = []
     highlights: list[str] = []
 
     for planet, lon in transit_positions.items():
-        sign = sign_from_longitude(lon)
-        h_lagna = house_from_lagna(sign, chart.lagna_sign)
-        h_moon = house_from_lagna(sign, moon_sign)
+        sign = sign_index(lon)
+        h_lagna = HOUSE_TABLE[sign][lagna_idx]
+        h_moon = HOUSE_TABLE[sign][moon_idx]
         positions.append(
             TransitPosition(
                 planet_name=planet,
                 sidereal_longitude=lon,
-                sign=sign,
+                sign=SIGNS[sign],
                 house_from_lagna=h_lagna,
                 house_from_moon=h_moon,
             )
         )
-        if planet == "Saturn" and h_moon in {12, 1, 2}:
-            highlights.append("Saturn is in Sade Sati zone from natal Moon (12/1/2 houses).")
-        if planet == "Jupiter" and h_lagna in {1, 5, 9}:
-            highlights.append("Jupiter transit activates trinal houses from Lagna (1/5/9).")
+        highlight = transit_highlight(planet, h_lagna, h_moon)
+        if highlight:
+            highlights.append(highlight)
     return TransitSnapshot(date=transit_date.date(), positions=positions, highlights=highlights)
+
+
+def sidereal_positions(
+    backend: BaseEphemerisBackend, jd: np.ndarray, planets: Sequence[str] | None = None
+) -> tuple[list[str], np.ndarray]:
+    """Return planet names and sidereal longitudes (planets x instants) from one batched ephemeris call."""
+    jd = np.atleast_1d(np.asarray(jd, dtype=float))
+    batch = backend.get_positions_batch_jd(jd, planets)
+    return batch.planets, np.mod(batch.longitudes - shared_ayanamsa_provider().batch(jd), 360.0)
+
+
+@dataclass(frozen=True)
+class SharedSky:
+    """Sidereal transit positions at one instant, computed once and mapped onto any number of charts."""
+
+    jd: float
+    planets: list[str]
+    longitudes: np.ndarray
+
+    @classmethod
+    def at(cls, backend: BaseEphemerisBackend, jd: float) -> SharedSky:
+        planets, longitudes = sidereal_positions(backend, np.array([jd]))
+        return cls(jd, planets, longitudes[:, 0])
+
+    @cached_property
+    def signs(self) -> np.ndarray:
+        return sign_indices(self.longitudes)
+
+    def houses(self, lagna_signs: np.ndarray, moon_signs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return houses from each chart's lagna and Moon sign, both shaped (charts, planets)."""
+        signs = self.signs[None, :]
+        return houses_from_lagna(signs, np.asarray(lagna_signs)[:, None]), houses_from_lagna(signs, np.asarray(moon_signs)[:, None])
+
+    def snapshots(self, lagna_signs: np.ndarray, moon_signs: np.ndarray) -> Iterator[dict]:
+        """Yield one ``TransitSnapshot``-shaped dict per chart, without building models."""
+        day = datetime_from_julian_day(self.jd).date().isoformat()
+        signs = [SIGNS[s] for s in self.signs.tolist()]
+        longitudes = self.longitudes.tolist()
+        h_lagna, h_moon = self.houses(lagna_signs, moon_signs)
+        for row_lagna, row_moon in zip(h_lagna.tolist(), h_moon.tolist()):
+            positions = []
+            highlights = []
+            for planet, lon, sign, hl, hm in zip(self.planets, longitudes, signs, row_lagna, row_moon):
+                positions.append(
+                    {"planet_name": planet, "sidereal_longitude": lon, "sign": sign, "house_from_lagna": hl, "house_from_moon": hm}
+                )
+                highlight = transit_highlight(planet, hl, hm)
+                if highlight:
+                    highlights.append(highlight)
+            yield {"date": day, "positions": positions, "highlights": highlights}
+
+
+@dataclass(frozen=True)
+class HouseInterval:
+    """A planet's stay in one sidereal sign, with the houses that sign occupies for a chart."""
+
+    planet: str
+    sign: int
+    start_jd: float
+    end_jd: float
+    house_from_lagna: int = 0
+    house_from_moon: int = 0
+
+    @property
+    def start(self) -> datetime:
+        return datetime_from_julian_day(self.start_jd)
+
+    @property
+    def end(self) -> datetime:
+        return datetime_from_julian_day(self.end_jd)
+
+
+def sign_intervals(finder: IngressFinder, planet: str, start_jd: float, end_jd: float) -> list[HouseInterval]:
+    """Return the run-length sign occupancy of ``planet`` over ``[start_jd, end_jd]``.
+
+    Built from sign ingresses, so the cost scales with the number of sign
+    changes rather than the number of days. Houses are left unset; see
+    :func:`house_intervals`.
+    """
+    _, longitudes = sidereal_positions(finder.backend, np.array([start_jd]), [planet])
+    sign = sign_index(float(longitudes[0, 0]))
+    cursor = start_jd
+    intervals: list[HouseInterval] = []
+    for event in finder.find(planet, "sign", datetime_from_julian_day(start_jd), datetime_from_julian_day(end_jd)):
+        if event.jd <= cursor:
+            continue
+        intervals.append(HouseInterval(planet, sign, cursor, event.jd))
+        sign, cursor = event.to_index, event.jd
+    intervals.append(HouseInterval(planet, sign, cursor, end_jd))
+    return intervals
+
+
+def house_intervals(intervals: Sequence[HouseInterval], lagna_sign: int, moon_sign: int) -> list[HouseInterval]:
+    """Map sign intervals onto one chart's houses from natal Lagna and Moon."""
+    return [
+        HouseInterval(i.planet, i.sign, i.start_jd, i.end_jd, HOUSE_TABLE[i.sign][lagna_sign], HOUSE_TABLE[i.sign][moon_sign])
+        for i in intervals
+    ]
@@ -0,0 +1,103 @@
+"""Divisional charts (vargas) derived from sidereal longitudes.
+
+Every varga is a lookup table indexed by rashi and division number, so all
+requested vargas for all bodies are classified in one array operation.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Sequence
+
+import numpy as np
+
+from .vedic_calculations import SIGNS, sign_indices
+
+VARGA_NAMES = {
+    "D1": "Rashi",
+    "D2": "Hora",
+    "D3": "Drekkana",
+    "D4": "Chaturthamsha",
+    "D7": "Saptamsha",
+    "D9": "Navamsha",
+    "D10": "Dashamsha",
+    "D12": "Dwadashamsha",
+    "D16": "Shodashamsha",
+    "D20": "Vimshamsha",
+    "D24": "Chaturvimshamsha",
+    "D27": "Bhamsha",
+    "D30": "Trimshamsha",
+    "D40": "Khavedamsha",
+    "D45": "Akshavedamsha",
+    "D60": "Shashtiamsha",
+}
+
+
+def _modality(sign: int) -> int:
+    return sign % 3  # 0 movable, 1 fixed, 2 dual
+
+
+def _odd(sign: int) -> bool:
+    return sign % 2 == 0  # Aries (index 0) is the first, odd sign
+
+
+def _counted(divisions: int, start: Callable[[int], int], step: int = 1) -> np.ndarray:
+    """Table where division k of a sign falls ``step * k`` signs after ``start(sign)``."""
+    return np.array([[(start(s) + step * k) % 12 for k in range(divisions)] for s in range(12)], dtype=np.int8)
+
+
+def _trimshamsha() -> np.ndarray:
+    """D30 on one-degree slots: unequal planetary portions of 5/5/8/7/5 (odd) and 5/7/8/5/5 (even) degrees."""
+    odd = [(5, 0), (10, 10), (18, 8), (25, 2), (30, 6)]  # Mars, Saturn, Jupiter, Mercury, Venus
+    even = [(5, 1), (12, 5), (20, 11), (25, 9), (30, 7)]  # Venus, Mercury, Jupiter, Saturn, Mars
+    rows = []
+    for s in range(12):
+        portions = odd if _odd(s) else even
+        rows.append([next(sign for end, sign in portions if degree < end) for degree in range(30)])
+    return np.array(rows, dtype=np.int8)
+
+
+VARGA_TABLES: dict[str, np.ndarray] = {
+    "D1": _counted(1, lambda s: s),
+    "D2": np.array([[4, 3] if _odd(s) else [3, 4] for s in range(12)], dtype=np.int8),
+    "D3": _counted(3, lambda s: s, step=4),
+    "D4": _counted(4, lambda s: s, step=3),
+    "D7": _counted(7, lambda s: s if _odd(s) else s + 6),
+    "D9": _counted(9, lambda s: s + (0, 8, 4)[_modality(s)]),
+    "D10": _counted(10, lambda s: s if _odd(s) else s + 8),
+    "D12": _counted(12, lambda s: s),
+    "D16": _counted(16, lambda s: (0, 4, 8)[_modality(s)]),
+    "D20": _counted(20, lambda s: (0, 8, 4)[_modality(s)]),
+    "D24": _counted(24, lambda s: 4 if _odd(s) else 3),
+    "D27": _counted(27, lambda s: (0, 3, 6, 9)[s % 4]),
+    "D30": _trimshamsha(),
+    "D40": _counted(40, lambda s: 0 if _odd(s) else 6),
+    "D45": _counted(45, lambda s: (0, 4, 8)[_modality(s)]),
+    "D60": _counted(60, lambda s: s),
+}
+
+
+def varga_sign_indices(longitudes: np.ndarray, vargas: Sequence[str] = tuple(VARGA_TABLES)) -> np.ndarray:
+    """Return varga sign indices with shape ``(len(vargas), len(longitudes))``.
+
+    The requested tables are flattened side by side, so the lookup for every
+    varga and body is a single fancy-index.
+    """
+    unknown = [v for v in vargas if v not in VARGA_TABLES]
+    if unknown:
+        raise ValueError(f"Unknown vargas: {', '.join(unknown)} (expected one of {', '.join(VARGA_TABLES)})")
+    lon = np.mod(np.asarray(longitudes, dtype=float), 360.0)
+    signs = sign_indices(lon).astype(np.int64)
+    within = lon - signs * 30.0
+    tables = [VARGA_TABLES[v] for v in vargas]
+    slots = np.array([t.shape[1] for t in tables], dtype=np.int64)[:, None]
+    offsets = np.concatenate([[0], np.cumsum([t.size for t in tables])[:-1]]).astype(np.int64)[:, None]
+    flat = np.concatenate([t.ravel() for t in tables])
+    k = np.minimum((within * slots / 30.0).astype(np.int64), slots - 1)
+    return flat[offsets + signs * slots + k]
+
+
+def compute_vargas(longitudes: dict[str, float], vargas: Sequence[str] = tuple(VARGA_TABLES)) -> dict[str, dict[str, str]]:
+    """Return ``{varga: {body: sign name}}`` for named sidereal longitudes."""
+    bodies = list(longitudes)
+    table = varga_sign_indices(np.array([longitudes[b] for b in bodies]), vargas)
+    return {v: {b: SIGNS[i] for b, i in zip(bodies, row.tolist())} for v, row in zip(vargas, table)}
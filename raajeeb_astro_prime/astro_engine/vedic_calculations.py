@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from math import floor
-from zoneinfo import ZoneInfo
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import numpy as np
+
+from .ascendant import ascendant_longitudes
+from .timezones import local_to_utc
 
 SIGNS = [
     "Aries",
@@ -28,6 +32,21 @@ NAKSHATRAS = [
     "Uttara Bhadrapada", "Revati",
 ]
 
+PLANET_NAMES = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu"]
+
+SIGN_INDEX = {name: i for i, name in enumerate(SIGNS)}
+PLANET_INDEX = {name: i for i, name in enumerate(PLANET_NAMES)}
+
+# HOUSE_TABLE[planet_sign][reference_sign] is the whole-sign house (1-12).
+HOUSE_TABLE = tuple(tuple((p - r) % 12 + 1 for r in range(12)) for p in range(12))
+HOUSE_ARRAY = np.array(HOUSE_TABLE, dtype=np.int8)
+
+NAKSHATRA_SPAN = 13.3333333333
+PADA_SPAN = NAKSHATRA_SPAN / 4
+
+J2000_UTC = datetime(2000, 1, 1, 12, tzinfo=timezone.utc)
+UNIX_EPOCH_JD = 2440587.5  # engine internals run on float UTC Julian days; datetimes only at the edges
+
 
 def normalize_degrees(value: float) -> float:
     """Normalize degrees to [0, 360)."""
@@ -46,54 +65,84 @@ def approximate_lahiri_ayanamsa(dt_utc: datetime) -> float:
     return base + years * 0.013968
 
 
+def sign_index(longitude: float) -> int:
+    """Return the rashi index (0 = Aries) of a longitude."""
+    return int(normalize_degrees(longitude) // 30) % 12
+
+
+def nakshatra_pada_index(longitude: float) -> tuple[int, int]:
+    """Return the nakshatra index (0 = Ashwini) and pada (1-4) of a sidereal longitude."""
+    lon = normalize_degrees(longitude)
+    pada = int(lon % NAKSHATRA_SPAN // PADA_SPAN) + 1
+    return min(int(lon // NAKSHATRA_SPAN), 26), min(pada, 4)
+
+
+def sign_indices(longitudes: np.ndarray) -> np.ndarray:
+    """Vectorized :func:`sign_index` over an array of longitudes."""
+    return (np.floor_divide(np.mod(np.asarray(longitudes, dtype=float), 360.0), 30.0).astype(np.int8)) % 12
+
+
+def nakshatra_pada_indices(longitudes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized :func:`nakshatra_pada_index`: nakshatra indices and padas (1-4)."""
+    lon = np.mod(np.asarray(longitudes, dtype=float), 360.0)
+    nakshatra = np.minimum(np.floor_divide(lon, NAKSHATRA_SPAN), 26).astype(np.int8)
+    pada = np.minimum(np.floor_divide(np.mod(lon, NAKSHATRA_SPAN), PADA_SPAN) + 1, 4).astype(np.int8)
+    return nakshatra, pada
+
+
+def houses_from_lagna(signs: np.ndarray, lagna_signs: np.ndarray | int) -> np.ndarray:
+    """Vectorized whole-sign houses (1-12) for sign indices against lagna indices; inputs broadcast."""
+    return HOUSE_ARRAY[np.asarray(signs), np.asarray(lagna_signs)]
+
+
 def sign_from_longitude(longitude: float) -> str:
     """Return rashi sign from longitude."""
-    return SIGNS[int(normalize_degrees(longitude) // 30)]
+    return SIGNS[sign_index(longitude)]
 
 
 def house_from_lagna(planet_sign: str, lagna_sign: str) -> int:
     """Return whole-sign house number relative to Lagna sign."""
-    p_idx = SIGNS.index(planet_sign)
-    l_idx = SIGNS.index(lagna_sign)
-    return ((p_idx - l_idx) % 12) + 1
+    return HOUSE_TABLE[SIGN_INDEX[planet_sign]][SIGN_INDEX[lagna_sign]]
 
 
 def nakshatra_and_pada(longitude: float) -> tuple[str, int]:
     """Return nakshatra name and pada from sidereal longitude."""
-    seg = 13.3333333333
-    n_index = int(normalize_degrees(longitude) // seg)
-    within = normalize_degrees(longitude) % seg
-    pada = int(within // (seg / 4)) + 1
-    return NAKSHATRAS[n_index], min(pada, 4)
+    n_index, pada = nakshatra_pada_index(longitude)
+    return NAKSHATRAS[n_index], pada
 
 
-def to_utc_datetime(date_str: str, time_str: str, timezone_name: str) -> datetime:
-    """Convert local date/time into UTC datetime."""
-    local_dt = datetime.fromisoformat(f"{date_str}T{time_str}").replace(tzinfo=ZoneInfo(timezone_name))
-    return local_dt.astimezone(timezone.utc)
+def to_utc_datetime(date_str: str, time_str: str, timezone_name: str, fold: Optional[int] = None) -> datetime:
+    """Convert local date/time into UTC datetime; see :func:`timezones.local_to_utc` for DST handling."""
+    return local_to_utc(datetime.fromisoformat(f"{date_str}T{time_str}"), timezone_name, fold)
 
 
 def julian_day(dt_utc: datetime) -> float:
-    """Compute Julian day number (UTC)."""
-    y = dt_utc.year
-    m = dt_utc.month
-    d = dt_utc.day + (dt_utc.hour + dt_utc.minute / 60 + dt_utc.second / 3600) / 24
-    if m <= 2:
-        y -= 1
-        m += 12
-    a = floor(y / 100)
-    b = 2 - a + floor(a / 4)
-    return floor(365.25 * (y + 4716)) + floor(30.6001 * (m + 1)) + d + b - 1524.5
+    """Compute Julian day number (UTC); naive datetimes are taken as UTC."""
+    if dt_utc.tzinfo is None:
+        dt_utc = dt_utc.replace(tzinfo=timezone.utc)
+    return dt_utc.timestamp() / 86400.0 + UNIX_EPOCH_JD
+
+
+def datetime_from_julian_day(jd: float) -> datetime:
+    """Convert a UTC Julian day back into an aware UTC datetime."""
+    return J2000_UTC + timedelta(days=jd - 2451545.0)
+
+
+def julian_days_from_datetime64(times: np.ndarray) -> np.ndarray:
+    """Vectorized :func:`julian_day` over a ``datetime64`` array of UTC instants."""
+    micros = np.asarray(times, dtype="datetime64[us]").astype(np.int64)
+    return micros / 86_400_000_000.0 + UNIX_EPOCH_JD
+
+
+def datetime64_from_julian_days(jd: np.ndarray) -> np.ndarray:
+    """Vectorized inverse of :func:`julian_days_from_datetime64`, rounded to the microsecond."""
+    micros = np.rint((np.asarray(jd, dtype=float) - UNIX_EPOCH_JD) * 86_400_000_000.0).astype(np.int64)
+    return micros.astype("datetime64[us]")
 
 
 def approximate_lagna_longitude(dt_utc: datetime, longitude: float, latitude: float) -> float:
-    """Approximate ascendant longitude using local sidereal time.
+    """Return the tropical ascendant longitude for one instant and place.
 
-    This is intentionally simple and deterministic for offline mode.
+    Scalar wrapper over :func:`ascendant.ascendant_longitudes`.
     """
-    jd = julian_day(dt_utc)
-    t = (jd - 2451545.0) / 36525.0
-    gmst = 280.46061837 + 360.98564736629 * (jd - 2451545.0) + 0.000387933 * t**2
-    lst = normalize_degrees(gmst + longitude)
-    correction = latitude * 0.1
-    return normalize_degrees(lst + correction)
+    return float(ascendant_longitudes(julian_day(dt_utc), latitude, longitude))
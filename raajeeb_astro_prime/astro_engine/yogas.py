@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import csv
+from functools import lru_cache
 from pathlib import Path
 
 from raajeeb_astro_prime.models.astro_core import Chart
+from .vedic_calculations import PLANET_INDEX, PLANET_NAMES
 
 
 def load_yoga_rules(csv_path: Path) -> list[dict[str, str]]:
@@ -14,20 +16,32 @@ def load_yoga_rules(csv_path: Path) -> list[dict[str, str]]:
         return list(csv.DictReader(handle))
 
 
+@lru_cache(maxsize=None)
+def _compile_rule(planets: str, condition: str) -> tuple[tuple[int, ...] | None, int]:
+    """Return a rule's planet indices (None if any is unknown) and target house (0 = same house, -1 = unknown)."""
+    names = [x.strip() for x in planets.split("+")]
+    indices = None if any(n not in PLANET_INDEX for n in names) else tuple(PLANET_INDEX[n] for n in names)
+    if condition == "same_house":
+        return indices, 0
+    if condition.startswith("house_"):
+        return indices, int(condition.split("_")[1])
+    return indices, -1
+
+
 def detect_yogas(chart: Chart, yoga_rows: list[dict[str, str]]) -> list[dict[str, str]]:
     """Detect simple yogas from conjunction and house rules."""
-    placements = {p.planet_name: p for p in chart.planet_positions}
+    houses = [0] * len(PLANET_NAMES)  # 0 marks a planet missing from the chart
+    for p in chart.planet_positions:
+        houses[PLANET_INDEX[p.planet_name]] = p.house
     found: list[dict[str, str]] = []
 
     for rule in yoga_rows:
-        planets = [x.strip() for x in rule["planets"].split("+")]
-        if all(p in placements for p in planets):
-            if rule["condition"] == "same_house":
-                houses = {placements[p].house for p in planets}
-                if len(houses) == 1:
-                    found.append(rule)
-            elif rule["condition"].startswith("house_"):
-                target_house = int(rule["condition"].split("_")[1])
-                if all(placements[p].house == target_house for p in planets):
-                    found.append(rule)
+        planets, target = _compile_rule(rule["planets"], rule["condition"])
+        if planets is None or not all(houses[i] for i in planets):
+            continue
+        if target == 0:
+            if len({houses[i] for i in planets}) == 1:
+                found.append(rule)
+        elif all(houses[i] == target for i in planets):
+            found.append(rule)
     return found
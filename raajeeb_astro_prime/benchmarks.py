@@ -0,0 +1,204 @@
+"""Offline accuracy and throughput benchmarks for the astrology engine."""
+
+from __future__ import annotations
+
+import csv
+import random
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from time import perf_counter
+
+from raajeeb_astro_prime.astro_engine.ephemeris_backend import (
+    PLANETS,
+    BaseEphemerisBackend,
+    CsvEphemerisBackend,
+    SwissEphemerisBackend,
+)
+
+
+def _angle_error(a: float, b: float) -> float:
+    return abs((a - b + 180.0) % 360.0 - 180.0)
+
+
+def _per_call_us(backend: BaseEphemerisBackend, instants: list[datetime]) -> float:
+    started = perf_counter()
+    for instant in instants:
+        backend.get_positions(instant)
+    return (perf_counter() - started) / len(instants) * 1e6
+
+
+def write_swiss_csv(path: Path, start: datetime, days: int, swiss: SwissEphemerisBackend | None = None) -> None:
+    """Write daily 00:00 UTC Swiss positions in the ephemeris CSV layout."""
+    swiss = swiss or SwissEphemerisBackend()
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["date", *PLANETS])
+        for offset in range(days):
+            day = start + timedelta(days=offset)
+            positions = swiss.get_positions(day)
+            writer.writerow([day.date().isoformat(), *(f"{positions[p].longitude:.6f}" for p in PLANETS)])
+
+
+def bench_csv_interpolation(days: int = 120, samples: int = 500, seed: int = 7) -> dict[str, object]:
+    """Compare interpolated CSV positions and speeds against Swiss Ephemeris.
+
+    A CSV is generated from Swiss output at daily resolution, then both backends
+    are queried at random sub-day instants inside the table.
+    """
+    swiss = SwissEphemerisBackend()
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    rng = random.Random(seed)
+    instants = [start + timedelta(days=rng.uniform(0, days - 1)) for _ in range(samples)]
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "ephemeris.csv"
+        write_swiss_csv(csv_path, start, days, swiss)
+        interpolated = CsvEphemerisBackend(csv_path, interpolate=True)
+        daily = CsvEphemerisBackend(csv_path)
+        errors = {p: {"max_lon": 0.0, "max_speed": 0.0, "max_lon_daily": 0.0} for p in PLANETS}
+        for instant in instants:
+            ref = swiss.get_positions(instant)
+            got = interpolated.get_positions(instant)
+            raw = daily.get_positions(instant)
+            for planet in PLANETS:
+                row = errors[planet]
+                row["max_lon"] = max(row["max_lon"], _angle_error(got[planet].longitude, ref[planet].longitude))
+                row["max_lon_daily"] = max(row["max_lon_daily"], _angle_error(raw[planet].longitude, ref[planet].longitude))
+                if ref[planet].speed is not None and got[planet].speed is not None:
+                    row["max_speed"] = max(row["max_speed"], abs(got[planet].speed - ref[planet].speed))
+        timings = {
+            "csv_daily_us": _per_call_us(daily, instants),
+            "csv_interpolated_us": _per_call_us(interpolated, instants),
+            "swiss_us": _per_call_us(swiss, instants),
+        }
+    return {"errors": errors, "timings": timings}
+
+
+def bench_chebyshev(
+    planet: str,
+    layouts: list[tuple[float, int]],
+    years: int = 20,
+    samples: int = 2000,
+    seed: int = 7,
+) -> list[dict[str, float]]:
+    """Measure the segment-length/degree trade-off for one body.
+
+    Each layout is fitted over ``years`` from J2000 and checked against Swiss at
+    random instants; storage is scaled to the 400-year 1800-2200 span.
+    """
+    import numpy as np
+
+    from raajeeb_astro_prime.astro_engine.ephemeris_chebyshev import evaluate_series, fit_chebyshev_series
+
+    swiss = SwissEphemerisBackend()
+    key = swiss.SWISS_MAP[planet]
+    start_jd = 2451545.0
+    span = years * 365.25
+    rng = random.Random(seed)
+    instants = np.array([start_jd + rng.uniform(0, span) for _ in range(samples)])
+    reference = np.array([swiss.swe.calc_ut(jd, key)[0][:4] for jd in instants.tolist()])
+    rows: list[dict[str, float]] = []
+    for segment_days, degree in layouts:
+        series = fit_chebyshev_series(swiss, planet, start_jd, start_jd + span, segment_days, degree)
+        started = perf_counter()
+        lons, speeds = evaluate_series(series, instants)
+        elapsed = perf_counter() - started
+        lon_err = np.abs((lons - reference[:, 0] + 180.0) % 360.0 - 180.0)
+        rows.append(
+            {
+                "segment_days": segment_days,
+                "degree": degree,
+                "max_err_arcsec": float(lon_err.max()) * 3600.0,
+                "max_speed_err": float(np.abs(speeds - reference[:, 3]).max()),
+                "ns_per_eval": elapsed / samples * 1e9,
+                "mb_per_400y": (degree + 1) * 8 * 400 * 365.25 / segment_days / 1e6,
+            }
+        )
+    return rows
+
+
+def bench_planet_subset(days: int = 3650, step_hours: float = 24.0) -> list[dict[str, float]]:
+    """Time Swiss range scans for all bodies versus Moon-only and Saturn-only subsets."""
+    import numpy as np
+
+    swiss = SwissEphemerisBackend()
+    count = int(days * 24 / step_hours)
+    times = np.datetime64("2026-01-01T00:00", "us") + (np.arange(count) * step_hours * 3_600_000_000).astype("timedelta64[us]")
+    rows: list[dict[str, float]] = []
+    baseline = 0.0
+    for label, planets in (("all", None), ("Moon", ["Moon"]), ("Saturn", ["Saturn"]), ("Rahu+Ketu", ["Rahu", "Ketu"])):
+        started = perf_counter()
+        swiss.get_positions_batch(times, planets)
+        elapsed = perf_counter() - started
+        baseline = baseline or elapsed
+        rows.append({"subset": label, "instants": count, "seconds": elapsed, "speedup": baseline / elapsed})
+    return rows
+
+
+def bench_ascendant(count: int = 100_000, seed: int = 7) -> dict[str, float]:
+    """Time the batched ascendant kernel against the scalar wrapper and Swiss houses."""
+    import numpy as np
+
+    from raajeeb_astro_prime.astro_engine.ascendant import ascendant_longitudes
+    from raajeeb_astro_prime.astro_engine.vedic_calculations import approximate_lagna_longitude, datetime_from_julian_day
+
+    rng = np.random.default_rng(seed)
+    jd = 2451545.0 + rng.uniform(-36525.0, 36525.0, count)
+    latitude = rng.uniform(-60.0, 60.0, count)
+    longitude = rng.uniform(-180.0, 180.0, count)
+    started = perf_counter()
+    batched = ascendant_longitudes(jd, latitude, longitude)
+    batch_seconds = perf_counter() - started
+    scalar_count = min(count, 5000)
+    instants = [datetime_from_julian_day(x) for x in jd[:scalar_count].tolist()]
+    started = perf_counter()
+    for instant, lat, lon in zip(instants, latitude.tolist(), longitude.tolist()):
+        approximate_lagna_longitude(instant, lon, lat)
+    scalar_seconds = perf_counter() - started
+    report = {
+        "count": float(count),
+        "batch_ns_per_lagna": batch_seconds / count * 1e9,
+        "scalar_ns_per_lagna": scalar_seconds / scalar_count * 1e9,
+    }
+    try:
+        swiss = SwissEphemerisBackend().swe
+    except Exception:
+        return report
+    reference = np.array([swiss.houses(j, la, lo, b"W")[1][0] for j, la, lo in zip(jd[:scalar_count].tolist(), latitude.tolist(), longitude.tolist())])
+    report["max_err_arcsec"] = float(np.abs((batched[:scalar_count] - reference + 180.0) % 360.0 - 180.0).max()) * 3600.0
+    return report
+
+
+def bench_dasha(births: int = 2000, lookups: int = 20, batch_births: int = 100_000, seed: int = 7) -> list[dict[str, float | str]]:
+    """Run the same birth and lookup workload through every dasha system."""
+    import numpy as np
+
+    from raajeeb_astro_prime.astro_engine.dasha import DASHA_SYSTEMS, LEVELS, DashaBatch, DashaTree
+
+    rng = np.random.default_rng(seed)
+    birth_jd = rng.uniform(2415020.5, 2460000.5, batch_births)
+    moon = rng.uniform(0.0, 360.0, batch_births)
+    targets = rng.uniform(2451545.0, 2469807.0, lookups).tolist()
+    rows: list[dict[str, float | str]] = []
+    for name, system in DASHA_SYSTEMS.items():
+        started = perf_counter()
+        trees = [DashaTree(system, jd, lon) for jd, lon in zip(birth_jd[:births].tolist(), moon[:births].tolist())]
+        build_seconds = perf_counter() - started
+        started = perf_counter()
+        for tree in trees:
+            for jd in targets:
+                tree.rows_at(jd, len(LEVELS))
+        lookup_seconds = perf_counter() - started
+        started = perf_counter()
+        DashaBatch(system, birth_jd, moon).at(2461000.5)
+        batch_seconds = perf_counter() - started
+        rows.append(
+            {
+                "system": name,
+                "build_us": build_seconds / births * 1e6,
+                "lookup_us": lookup_seconds / (births * lookups) * 1e6,
+                "rows_per_tree": sum(len(tree.table) for tree in trees) / births,
+                "batch_ns": batch_seconds / batch_births * 1e9,
+            }
+        )
+    return rows
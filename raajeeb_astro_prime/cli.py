@@ -4,31 +4,65 @@ from __future__ import annotations
 
 import json
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import typer
 
+from raajeeb_astro_prime.astro_engine.ascendant import ascendant_longitudes
+from raajeeb_astro_prime.astro_engine.ayanamsa import shared_ayanamsa_provider
 from raajeeb_astro_prime.astro_engine.compatibility import compute_ashta_kuta
-from raajeeb_astro_prime.astro_engine.dasha import (
-    build_vimshottari_periods,
-    current_dasha,
-    dasha_lord_from_moon_nakshatra,
+from raajeeb_astro_prime.astro_engine.dasha import DASHA_SYSTEMS, LEVELS, VIMSHOTTARI, DashaBatch, DashaSystem, DashaTree
+from raajeeb_astro_prime.astro_engine.ephemeris_backend import (
+    PLANETS,
+    BaseEphemerisBackend,
+    CsvEphemerisBackend,
+    SwissEphemerisBackend,
+    shared_ephemeris_backend,
 )
-from raajeeb_astro_prime.astro_engine.ephemeris_backend import build_ephemeris_backend
-from raajeeb_astro_prime.astro_engine.transit import compute_transit_snapshot
+from raajeeb_astro_prime.astro_engine.ephemeris_binary import compile_binary_ephemeris
+from raajeeb_astro_prime.astro_engine.ephemeris_chebyshev import (
+    DEFAULT_SEGMENTS,
+    fit_chebyshev_ephemeris,
+    save_chebyshev_ephemeris,
+)
+from raajeeb_astro_prime.astro_engine.events import (
+    BOUNDARY_WIDTHS,
+    STATIONARY_PLANETS,
+    shared_ingress_finder,
+    shared_lagna_finder,
+    shared_station_finder,
+)
+from raajeeb_astro_prime.astro_engine.timezones import (
+    OK,
+    AmbiguousLocalTimeError,
+    NonexistentLocalTimeError,
+    local_to_utc,
+    local_to_utc_batch,
+)
+from raajeeb_astro_prime.astro_engine.transit import SharedSky, compute_transit_snapshot, house_intervals, sign_intervals
+from raajeeb_astro_prime.astro_engine.vargas import VARGA_NAMES, VARGA_TABLES, compute_vargas
 from raajeeb_astro_prime.astro_engine.vedic_calculations import (
-    approximate_lahiri_ayanamsa,
+    HOUSE_TABLE,
+    NAKSHATRAS,
+    SIGN_INDEX,
+    SIGNS,
     approximate_lagna_longitude,
+    datetime64_from_julian_days,
     house_from_lagna,
-    nakshatra_and_pada,
+    julian_day,
+    julian_days_from_datetime64,
+    nakshatra_pada_index,
     sign_from_longitude,
-    to_utc_datetime,
+    sign_index,
+    sign_indices,
     tropical_to_sidereal,
 )
 from raajeeb_astro_prime.astro_engine.yogas import detect_yogas, load_yoga_rules
-from raajeeb_astro_prime.config.settings import get_settings
+from raajeeb_astro_prime.config.settings import AppSettings, get_settings
 from raajeeb_astro_prime.llm.gpt4all_client import GPT4AllClient
 from raajeeb_astro_prime.llm.renderer import (
     render_chart_summary,
@@ -36,7 +70,7 @@ from raajeeb_astro_prime.llm.renderer import (
     render_dasha_now,
     render_transit,
 )
-from raajeeb_astro_prime.models.astro_core import BirthDetails, Chart, PlanetPosition
+from raajeeb_astro_prime.models.astro_core import BirthDetails, Chart, PlanetPosition, Profile
 from raajeeb_astro_prime.storage.profiles import ProfileStore
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
@@ -45,54 +79,105 @@ LOGGER = logging.getLogger(__name__)
 app = typer.Typer(help="Raajeeb AstroAlchemy Prime 2.0 (Astro Logic Prime)")
 profile_app = typer.Typer(help="Profile management commands")
 chart_app = typer.Typer(help="Chart view commands")
-dasha_app = typer.Typer(help="Vimshottari dasha commands")
+dasha_app = typer.Typer(help="Dasha commands (Vimshottari, Yogini, Ashtottari)")
+ephemeris_app = typer.Typer(help="Ephemeris data commands")
+bench_app = typer.Typer(help="Offline engine benchmarks")
 app.add_typer(profile_app, name="profile")
 app.add_typer(chart_app, name="chart")
 app.add_typer(dasha_app, name="dasha")
+app.add_typer(ephemeris_app, name="ephemeris")
+app.add_typer(bench_app, name="bench")
 
 
 def _load_persona_prompt(path: Path) -> str:
     return path.read_text(encoding="utf-8")
 
 
+def _ephemeris_backend(settings: AppSettings) -> BaseEphemerisBackend:
+    return shared_ephemeris_backend(
+        settings.ephemeris_csv,
+        interpolate=settings.ephemeris_interpolate,
+        bin_path=settings.ephemeris_bin,
+        chebyshev_path=settings.ephemeris_chebyshev,
+        quantum_seconds=settings.sky_cache_quantum_seconds,
+        cache_size=settings.sky_cache_size,
+        tiers=tuple(settings.ephemeris_tiers),
+    )
+
+
+@app.callback()
+def root(
+    ctx: typer.Context,
+    ephemeris_stats: bool = typer.Option(
+        False, "--ephemeris-stats", help="Log per-tier ephemeris hit counts when the command exits"
+    ),
+) -> None:
+    if ephemeris_stats:
+        ctx.call_on_close(_log_ephemeris_stats)
+
+
+def _log_ephemeris_stats() -> None:
+    # Only report when the command actually built the shared backend.
+    if shared_ephemeris_backend.cache_info().currsize == 0:
+        LOGGER.info("Ephemeris lookups: none")
+        return
+    stats = _ephemeris_backend(get_settings()).tier_stats()
+    LOGGER.info("Ephemeris lookups: %s", ", ".join(f"{name}={hits}" for name, hits in stats.items()))
+
+
+def _birth_utc(birth: BirthDetails) -> datetime:
+    try:
+        return local_to_utc(datetime.combine(birth.date_of_birth, birth.time_of_birth), birth.timezone, birth.dst_fold)
+    except AmbiguousLocalTimeError as exc:
+        raise typer.BadParameter(
+            f"{exc} Pass --dst-fold 0|1 (to 'profile create', or 'profile set-dst-fold' for a stored profile)."
+        ) from exc
+    except NonexistentLocalTimeError as exc:
+        raise typer.BadParameter(f"{exc} Check the birth time and timezone.") from exc
+
+
 def _build_chart(name: str, birth: BirthDetails) -> Chart:
     settings = get_settings()
-    backend = build_ephemeris_backend(settings.ephemeris_csv)
-    dt_utc = to_utc_datetime(str(birth.date_of_birth), birth.time_of_birth.isoformat(), birth.timezone)
-    ayanamsa = approximate_lahiri_ayanamsa(dt_utc)
+    # Natal positions need the exact birth instant, so go beneath the quantized sky cache.
+    backend = _ephemeris_backend(settings).backend
+    dt_utc = _birth_utc(birth)
+    ayanamsa = shared_ayanamsa_provider().at(dt_utc)
     tropical = backend.get_positions(dt_utc)
 
     lagna_tropical = approximate_lagna_longitude(dt_utc, birth.longitude, birth.latitude)
     lagna_sidereal = tropical_to_sidereal(lagna_tropical, ayanamsa)
-    lagna_sign = sign_from_longitude(lagna_sidereal)
+    lagna_sign = sign_index(lagna_sidereal)
 
+    sidereal_longitudes = {planet: tropical_to_sidereal(data.longitude, ayanamsa) for planet, data in tropical.items()}
     positions: list[PlanetPosition] = []
     for planet, data in tropical.items():
-        sidereal = tropical_to_sidereal(data.longitude, ayanamsa)
-        sign = sign_from_longitude(sidereal)
-        house = house_from_lagna(sign, lagna_sign)
-        nak, pada = nakshatra_and_pada(sidereal)
+        sidereal = sidereal_longitudes[planet]
+        sign = sign_index(sidereal)
+        nak, pada = nakshatra_pada_index(sidereal)
         positions.append(
             PlanetPosition(
                 planet_name=planet,
                 sidereal_longitude=round(sidereal, 4),
-                sign=sign,
-                house=house,
-                nakshatra_name=nak,
+                sign=SIGNS[sign],
+                house=HOUSE_TABLE[sign][lagna_sign],
+                nakshatra_name=NAKSHATRAS[nak],
                 nakshatra_pada=pada,
                 speed=data.speed,
             )
         )
     moon_sign = next(p.sign for p in positions if p.planet_name == "Moon")
     sun_sign = next(p.sign for p in positions if p.planet_name == "Sun")
+    vargas = compute_vargas({**sidereal_longitudes, "Lagna": lagna_sidereal})
     return Chart(
         id=f"chart-{name.lower().replace(' ', '-')}",
         name=name,
         birth_details=birth,
-        lagna_sign=lagna_sign,
+        lagna_sign=SIGNS[lagna_sign],
         moon_sign=moon_sign,
         sun_sign=sun_sign,
         planet_positions=positions,
+        lagna_longitude=round(lagna_sidereal, 4),
+        vargas=vargas,
     )
 
 
@@ -104,6 +189,9 @@ def profile_create(
     timezone_name: str = typer.Option("Asia/Kolkata", prompt=True),
     latitude: float = typer.Option(..., prompt=True),
     longitude: float = typer.Option(..., prompt=True),
+    dst_fold: Optional[int] = typer.Option(
+        None, "--dst-fold", min=0, max=1, help="0 or 1: which occurrence of an ambiguous local time"
+    ),
     gender: Optional[str] = typer.Option(None),
     notes: Optional[str] = typer.Option(None),
 ) -> None:
@@ -116,15 +204,31 @@ def profile_create(
         timezone=timezone_name,
         latitude=latitude,
         longitude=longitude,
+        dst_fold=dst_fold,
         gender=gender,
         notes=notes,
     )
+    chart = _build_chart(name, birth)  # before saving, so a rejected local time leaves no half-made profile
     profile = store.create_profile(name, birth)
-    profile.chart = _build_chart(name, birth)
+    profile.chart = chart
     store.upsert(profile)
     typer.echo(f"Created profile: {profile.name} ({profile.id})")
 
 
+@profile_app.command("set-dst-fold")
+def profile_set_dst_fold(
+    profile: str = typer.Option(..., "--profile"),
+    fold: int = typer.Option(..., "--fold", min=0, max=1, help="0 = first occurrence, 1 = second"),
+) -> None:
+    """Choose which occurrence of an ambiguous birth time a stored profile means and rebuild its chart."""
+    store = ProfileStore(get_settings().profile_store)
+    prof = store.get_by_name(profile)
+    prof.birth_details.dst_fold = fold
+    prof.chart = _build_chart(prof.name, prof.birth_details)
+    store.upsert(prof)
+    typer.echo(f"Updated profile: {prof.name} (dst fold {fold})")
+
+
 @profile_app.command("list")
 def profile_list() -> None:
     """List all stored profiles."""
@@ -147,18 +251,57 @@ def chart_summary(profile: str = typer.Option(..., "--profile")) -> None:
 
 
 @chart_app.command("placements")
-def chart_placements(profile: str = typer.Option(..., "--profile")) -> None:
+def chart_placements(
+    profile: str = typer.Option(..., "--profile"),
+    varga: str = typer.Option("D1", "--varga", help=f"One of {', '.join(VARGA_TABLES)}"),
+) -> None:
     """Print placements in a tabular text layout."""
     store = ProfileStore(get_settings().profile_store)
     prof = store.get_by_name(profile)
     if prof.chart is None:
         prof.chart = _build_chart(prof.name, prof.birth_details)
         store.upsert(prof)
-    typer.echo("planet | sign | degree | house | nakshatra | pada")
-    for p in prof.chart.planet_positions:
-        typer.echo(
-            f"{p.planet_name:8} | {p.sign:11} | {p.sidereal_longitude:7.2f} | {p.house:5} | {p.nakshatra_name:15} | {p.nakshatra_pada}"
-        )
+    varga = varga.upper()
+    if varga not in VARGA_TABLES:
+        raise typer.BadParameter(f"--varga must be one of {', '.join(VARGA_TABLES)}.")
+    if varga == "D1":
+        typer.echo("planet | sign | degree | house | nakshatra | pada")
+        for p in prof.chart.planet_positions:
+            typer.echo(
+                f"{p.planet_name:8} | {p.sign:11} | {p.sidereal_longitude:7.2f} | {p.house:5} | {p.nakshatra_name:15} | {p.nakshatra_pada}"
+            )
+        return
+    if varga not in prof.chart.vargas:
+        # Charts saved before vargas were cached: derive them from the stored longitudes once.
+        longitudes = {p.planet_name: p.sidereal_longitude for p in prof.chart.planet_positions}
+        if prof.chart.lagna_longitude is not None:
+            longitudes["Lagna"] = prof.chart.lagna_longitude
+        prof.chart.vargas.update(compute_vargas(longitudes))
+        store.upsert(prof)
+    signs = prof.chart.vargas[varga]
+    lagna = signs.get("Lagna")
+    typer.echo(f"{varga} {VARGA_NAMES[varga]}" + (f" | Lagna {lagna}" if lagna else ""))
+    typer.echo("planet | sign | house")
+    for planet, sign in signs.items():
+        if planet == "Lagna":
+            continue
+        house = house_from_lagna(sign, lagna) if lagna else "-"
+        typer.echo(f"{planet:8} | {sign:11} | {house:>5}")
+
+
+def _dasha_system(name: str) -> DashaSystem:
+    system = DASHA_SYSTEMS.get(name.lower())
+    if system is None:
+        raise typer.BadParameter(f"Unknown dasha system {name!r}; expected one of {', '.join(DASHA_SYSTEMS)}.")
+    return system
+
+
+def _dasha_tree(store: ProfileStore, prof: Profile, system: DashaSystem = VIMSHOTTARI) -> DashaTree:
+    if prof.chart is None:
+        prof.chart = _build_chart(prof.name, prof.birth_details)
+        store.upsert(prof)
+    moon_lon = next(p.sidereal_longitude for p in prof.chart.planet_positions if p.planet_name == "Moon")
+    return DashaTree.from_birth(system, _birth_utc(prof.birth_details), moon_lon)
 
 
 @dasha_app.command("timeline")
@@ -166,58 +309,178 @@ def dasha_timeline(
     profile: str = typer.Option(..., "--profile"),
     from_date: str = typer.Option(..., "--from"),
     to_date: str = typer.Option(..., "--to"),
+    depth: int = typer.Option(2, "--depth", min=1, max=len(LEVELS), help="1 = maha ... 5 = prana"),
+    system: str = typer.Option("vimshottari", "--system", help=", ".join(DASHA_SYSTEMS)),
 ) -> None:
-    """Show Vimshottari dasha rows between date range."""
+    """Show dasha rows between date range."""
     store = ProfileStore(get_settings().profile_store)
-    prof = store.get_by_name(profile)
-    if prof.chart is None:
-        prof.chart = _build_chart(prof.name, prof.birth_details)
-        store.upsert(prof)
-    moon_lon = next(p.sidereal_longitude for p in prof.chart.planet_positions if p.planet_name == "Moon")
-    nak_idx = int(moon_lon // 13.3333333333)
-    start_lord = dasha_lord_from_moon_nakshatra(nak_idx)
-    birth_utc = to_utc_datetime(str(prof.birth_details.date_of_birth), prof.birth_details.time_of_birth.isoformat(), prof.birth_details.timezone)
-    periods = build_vimshottari_periods(start_lord, birth_utc)
-
-    f = datetime.strptime(from_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-    t = datetime.strptime(to_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-    for period in periods:
-        if period.start_datetime <= t and period.end_datetime >= f:
-            typer.echo(f"{period.level:10} {period.lord:8} {period.start_datetime.date()} -> {period.end_datetime.date()}")
+    tree = _dasha_tree(store, store.get_by_name(profile), _dasha_system(system))
+    f = julian_day(datetime.strptime(from_date, "%Y-%m-%d").replace(tzinfo=timezone.utc))
+    t = julian_day(datetime.strptime(to_date, "%Y-%m-%d").replace(tzinfo=timezone.utc))
+    for node in tree.overlapping(f, t, depth):
+        period = node.to_model()
+        typer.echo(f"{period.level:10} {period.lord:8} {period.start_datetime.date()} -> {period.end_datetime.date()}")
+
+
+@dataclass
+class _NatalColumns:
+    names: list[str]
+    birth_jd: np.ndarray
+    moon_longitude: np.ndarray
+    lagna_sign: np.ndarray
+
+
+def _natal_columns(store: ProfileStore, name: Optional[str] = None) -> _NatalColumns:
+    """Read the store once and return every profile's natal inputs as arrays.
+
+    Birth times are converted to UTC one timezone group at a time. Moon
+    longitudes and lagna signs come from stored charts; profiles without one
+    get theirs from a single batched ephemeris and ascendant pass.
+    """
+    records = [r for r in store.records() if name is None or r["name"].lower() == name.lower()]
+    details = [r["birth_details"] for r in records]
+    local = np.array([f"{b['date_of_birth']}T{b['time_of_birth']}" for b in details], dtype="datetime64[us]")
+    zones: dict[str, list[int]] = {}
+    for i, b in enumerate(details):
+        zones.setdefault(b["timezone"], []).append(i)
+    utc, status = np.empty(len(records), dtype="datetime64[us]"), np.empty(len(records), dtype=np.int8)
+    for zone, rows in zones.items():
+        utc[rows], status[rows] = local_to_utc_batch(local[rows], zone)
+    # The batch pass works in whole seconds; carry any sub-second birth time over.
+    births = julian_days_from_datetime64(utc + (local - local.astype("datetime64[s]")))
+    keep = np.ones(len(records), dtype=bool)
+    # Only DST edge cases need the profile's fold, so only they take the scalar path.
+    for i in np.flatnonzero(status != OK):
+        try:
+            births[i] = julian_day(_birth_utc(BirthDetails.model_validate(details[i])))
+        except typer.BadParameter as exc:
+            LOGGER.warning("Skipping profile %s: %s", records[i]["name"], exc.message)
+            keep[i] = False
+    names: list[str] = []
+    places: list[tuple[float, float]] = []
+    moons: list[float] = []
+    lagnas: list[int] = []
+    for record in (r for r, kept in zip(records, keep) if kept):
+        chart = record.get("chart") or {}
+        positions = chart.get("planet_positions", [])
+        names.append(record["name"])
+        places.append((record["birth_details"]["latitude"], record["birth_details"]["longitude"]))
+        moons.append(next((p["sidereal_longitude"] for p in positions if p["planet_name"] == "Moon"), np.nan))
+        lagnas.append(SIGN_INDEX[chart["lagna_sign"]] if chart else -1)
+    if name is not None and not names:
+        raise ValueError(f"Profile not found: {name}")
+    birth_jd, moon, lagna = births[keep], np.array(moons, dtype=float), np.array(lagnas, dtype=np.int8)
+    missing = np.flatnonzero(np.isnan(moon) | (lagna < 0))
+    if missing.size:
+        jd = birth_jd[missing]
+        ayanamsa = shared_ayanamsa_provider().batch(jd)
+        tropical = _ephemeris_backend(get_settings()).get_positions_batch_jd(jd, ["Moon"]).longitude("Moon")
+        moon[missing] = np.mod(tropical - ayanamsa, 360.0)
+        latitude, longitude = np.array(places, dtype=float)[missing].T
+        lagna[missing] = sign_indices(np.mod(ascendant_longitudes(jd, latitude, longitude) - ayanamsa, 360.0))
+    return _NatalColumns(names, birth_jd, moon, lagna)
+
+
+def _dasha_batch(store: ProfileStore, system: DashaSystem, name: Optional[str] = None) -> tuple[list[str], DashaBatch]:
+    """Return profile names with their dasha state as arrays."""
+    natal = _natal_columns(store, name)
+    return natal.names, DashaBatch(system, natal.birth_jd, natal.moon_longitude)
+
+
+def _dates(jd: np.ndarray) -> list[str]:
+    return [str(d) for d in datetime64_from_julian_days(jd).astype("datetime64[D]")]
 
 
 @dasha_app.command("now")
-def dasha_now(profile: str = typer.Option(..., "--profile"), on: Optional[str] = typer.Option(None, "--on")) -> None:
+def dasha_now(
+    profile: Optional[str] = typer.Option(None, "--profile"),
+    on: Optional[str] = typer.Option(None, "--on"),
+    all_profiles: bool = typer.Option(False, "--all", help="Evaluate every stored profile in one pass"),
+    system: str = typer.Option("vimshottari", "--system", help=", ".join(DASHA_SYSTEMS)),
+) -> None:
     """Show running Mahadasha and Antardasha for date."""
+    if (profile is None) == (not all_profiles):
+        raise typer.BadParameter("Pass either --profile or --all.")
+    dasha_system = _dasha_system(system)
     store = ProfileStore(get_settings().profile_store)
-    prof = store.get_by_name(profile)
-    if prof.chart is None:
-        prof.chart = _build_chart(prof.name, prof.birth_details)
-        store.upsert(prof)
-    moon_lon = next(p.sidereal_longitude for p in prof.chart.planet_positions if p.planet_name == "Moon")
-    nak_idx = int(moon_lon // 13.3333333333)
-    start_lord = dasha_lord_from_moon_nakshatra(nak_idx)
-    birth_utc = to_utc_datetime(str(prof.birth_details.date_of_birth), prof.birth_details.time_of_birth.isoformat(), prof.birth_details.timezone)
-    periods = build_vimshottari_periods(start_lord, birth_utc)
-
     on_dt = datetime.strptime(on, "%Y-%m-%d").replace(tzinfo=timezone.utc) if on else datetime.now(timezone.utc)
-    maha, antar = current_dasha(periods, on_dt)
-    typer.echo(render_dasha_now(maha.lord if maha else "Unknown", antar.lord if antar else None))
+    if all_profiles:
+        names, batch = _dasha_batch(store, dasha_system)
+        maha, antar, ends = batch.at(julian_day(on_dt))
+        running = np.flatnonzero(maha >= 0)
+        for i, until in zip(running.tolist(), _dates(ends[running])):
+            typer.echo(f"{names[i]:20} {dasha_system.lords[maha[i]]:8} {dasha_system.lords[antar[i]]:8} until {until}")
+        return
+    tree = _dasha_tree(store, store.get_by_name(profile), dasha_system)
+    path = tree.at(julian_day(on_dt))
+    typer.echo(render_dasha_now(path[0].lord if path else "Unknown", path[1].lord if len(path) > 1 else None))
+
+
+@dasha_app.command("changes")
+def dasha_changes(
+    from_date: str = typer.Option(..., "--from"),
+    to_date: str = typer.Option(..., "--to"),
+    profile: Optional[str] = typer.Option(None, "--profile"),
+    all_profiles: bool = typer.Option(False, "--all", help="Scan every stored profile in one pass"),
+    system: str = typer.Option("vimshottari", "--system", help=", ".join(DASHA_SYSTEMS)),
+) -> None:
+    """List Mahadasha and Antardasha changes starting between dates (end exclusive)."""
+    if (profile is None) == (not all_profiles):
+        raise typer.BadParameter("Pass either --profile or --all.")
+    store = ProfileStore(get_settings().profile_store)
+    dasha_system = _dasha_system(system)
+    names, batch = _dasha_batch(store, dasha_system, profile)
+    f = julian_day(datetime.strptime(from_date, "%Y-%m-%d").replace(tzinfo=timezone.utc))
+    t = julian_day(datetime.strptime(to_date, "%Y-%m-%d").replace(tzinfo=timezone.utc))
+    rows, starts, maha, antar = batch.changes(f, t)
+    for i, m, a, day in zip(rows.tolist(), maha.tolist(), antar.tolist(), _dates(starts)):
+        level = "maha" if m == a else "antar"
+        typer.echo(f"{day} {names[i]:20} {level:6} {dasha_system.lords[m]:8} {dasha_system.lords[a]}")
 
 
 @app.command("transit")
-def transit(profile: str = typer.Option(..., "--profile"), date: str = typer.Option(..., "--date")) -> None:
-    """Compute gochar snapshot and textual highlights."""
+def transit(
+    profile: Optional[str] = typer.Option(None, "--profile"),
+    date: Optional[str] = typer.Option(None, "--date"),
+    from_date: Optional[str] = typer.Option(None, "--from", help="Range start; use with --to instead of --date"),
+    to_date: Optional[str] = typer.Option(None, "--to"),
+    planets: str = typer.Option("Saturn,Jupiter", "--planets", help="Comma-separated planets for range scans"),
+    all_profiles: bool = typer.Option(False, "--all", help="Map one shared sky onto every stored chart"),
+    output: str = typer.Option("rows", "--format", help="rows or jsonl (with --all or a range)"),
+) -> None:
+    """Compute gochar snapshot and textual highlights, or house-occupancy intervals over a range."""
+    if (profile is None) == (not all_profiles):
+        raise typer.BadParameter("Pass either --profile or --all.")
+    if output not in {"rows", "jsonl"}:
+        raise typer.BadParameter("--format must be rows or jsonl.")
+    if date is not None and (from_date is not None or to_date is not None):
+        raise typer.BadParameter("--date cannot be combined with --from or --to.")
+    if date is None and (from_date is None or to_date is None):
+        raise typer.BadParameter("Pass either --date or both --from and --to.")
     settings = get_settings()
     store = ProfileStore(settings.profile_store)
+    if date is None:
+        wanted = [p.strip() for p in planets.split(",") if p.strip()]
+        unknown = [p for p in wanted if p not in PLANETS]
+        if unknown or not wanted:
+            raise typer.BadParameter(f"Unknown planets {', '.join(unknown)}; expected names from {', '.join(PLANETS)}.")
+        f = datetime.strptime(from_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        t = datetime.strptime(to_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        if t <= f:
+            raise typer.BadParameter("--to must be after --from.")
+        _transit_range(store, None if all_profiles else profile, wanted, julian_day(f), julian_day(t), output)
+        return
+    if all_profiles:
+        _transit_all(store, datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=timezone.utc), output)
+        return
     prof = store.get_by_name(profile)
     if prof.chart is None:
         prof.chart = _build_chart(prof.name, prof.birth_details)
         store.upsert(prof)
 
     dt = datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-    backend = build_ephemeris_backend(settings.ephemeris_csv)
-    ay = approximate_lahiri_ayanamsa(dt)
+    backend = _ephemeris_backend(settings)
+    ay = shared_ayanamsa_provider().at(dt)
     tropical = backend.get_positions(dt)
     sidereal = {k: tropical_to_sidereal(v.longitude, ay) for k, v in tropical.items()}
     snap = compute_transit_snapshot(prof.chart, sidereal, dt)
@@ -226,6 +489,106 @@ def transit(profile: str = typer.Option(..., "--profile"), date: str = typer.Opt
         typer.echo(f"{pos.planet_name}: {pos.sign} | H(Lagna)={pos.house_from_lagna} | H(Moon)={pos.house_from_moon}")
 
 
+def _transit_all(store: ProfileStore, dt: datetime, output: str) -> None:
+    """Stream one transit row per stored profile from a single shared sky."""
+    natal = _natal_columns(store)
+    sky = SharedSky.at(_ephemeris_backend(get_settings()), julian_day(dt))
+    moon_signs = sign_indices(natal.moon_longitude)
+    snapshots = sky.snapshots(natal.lagna_sign, moon_signs)
+    if output == "jsonl":
+        for name, snap in zip(natal.names, snapshots):
+            typer.echo(json.dumps({"profile": name, **snap}))
+        return
+    typer.echo(f"{'profile':20} | " + " ".join(f"{p[:2]:>5}" for p in sky.planets) + "  (house from Lagna/Moon)")
+    for name, snap in zip(natal.names, snapshots):
+        houses = " ".join(f"{p['house_from_lagna']:>2}/{p['house_from_moon']:<2}" for p in snap["positions"])
+        typer.echo(f"{name:20} | {houses}".rstrip())
+
+
+def _transit_range(store: ProfileStore, name: Optional[str], planets: list[str], start_jd: float, end_jd: float, output: str) -> None:
+    """Stream run-length house occupancy per profile, from sign intervals computed once per planet."""
+    natal = _natal_columns(store, name)
+    finder = shared_ingress_finder(_ephemeris_backend(get_settings()).backend)
+    signs = {planet: sign_intervals(finder, planet, start_jd, end_jd) for planet in planets}
+    moon_signs = sign_indices(natal.moon_longitude).tolist()
+    for profile, lagna, moon in zip(natal.names, natal.lagna_sign.tolist(), moon_signs):
+        for planet in planets:
+            for i in house_intervals(signs[planet], lagna, moon):
+                if output == "jsonl":
+                    row = {
+                        "profile": profile,
+                        "planet": planet,
+                        "sign": SIGNS[i.sign],
+                        "house_from_lagna": i.house_from_lagna,
+                        "house_from_moon": i.house_from_moon,
+                        "start": i.start.isoformat(timespec="seconds"),
+                        "end": i.end.isoformat(timespec="seconds"),
+                    }
+                    typer.echo(json.dumps(row))
+                else:
+                    typer.echo(
+                        f"{profile:20} {planet:8} {SIGNS[i.sign]:11} H(Lagna)={i.house_from_lagna:<2} "
+                        f"H(Moon)={i.house_from_moon:<2} {i.start:%Y-%m-%d} -> {i.end:%Y-%m-%d}"
+                    )
+
+
+@app.command("ingress")
+def ingress(
+    planet: str = typer.Option(..., "--planet"),
+    kind: str = typer.Option("sign", "--kind", help="sign, nakshatra or pada"),
+    from_date: str = typer.Option(..., "--from"),
+    to_date: str = typer.Option(..., "--to"),
+) -> None:
+    """List sidereal sign, nakshatra or pada ingresses of a planet over a date range."""
+    if planet not in PLANETS:
+        raise typer.BadParameter(f"Unknown planet {planet!r}; expected one of {', '.join(PLANETS)}.")
+    if kind not in BOUNDARY_WIDTHS:
+        raise typer.BadParameter(f"--kind must be one of {', '.join(BOUNDARY_WIDTHS)}.")
+    # Root finding needs exact instants, so go beneath the quantized sky cache.
+    finder = shared_ingress_finder(_ephemeris_backend(get_settings()).backend)
+    f = datetime.strptime(from_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    t = datetime.strptime(to_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    for event in finder.find(planet, kind, f, t):
+        retro = " (retrograde)" if event.retrograde else ""
+        typer.echo(
+            f"{event.instant:%Y-%m-%d %H:%M} UTC  {planet} {event.label(event.from_index)} -> {event.label(event.to_index)}{retro}"
+        )
+
+
+@app.command("lagna")
+def lagna(
+    date: str = typer.Option(..., "--date"),
+    latitude: float = typer.Option(..., "--lat"),
+    longitude: float = typer.Option(..., "--lon"),
+) -> None:
+    """List the instants the rising sign changes during a UTC day at a place."""
+    day = datetime.strptime(date, "%Y-%m-%d").date()
+    for event in shared_lagna_finder().changes(latitude, longitude, day):
+        typer.echo(f"{event.instant:%Y-%m-%d %H:%M:%S} UTC  Lagna {event.label(event.from_index)} -> {event.label(event.to_index)}")
+
+
+@app.command("stations")
+def stations(
+    planet: Optional[str] = typer.Option(None, "--planet", help="Defaults to every planet that can turn retrograde"),
+    from_date: str = typer.Option(..., "--from"),
+    to_date: str = typer.Option(..., "--to"),
+) -> None:
+    """List stationary-retrograde and stationary-direct instants over a date range."""
+    if planet is not None and planet not in STATIONARY_PLANETS:
+        raise typer.BadParameter(f"--planet must be one of {', '.join(STATIONARY_PLANETS)}.")
+    finder = shared_station_finder(_ephemeris_backend(get_settings()).backend)
+    f = datetime.strptime(from_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    t = datetime.strptime(to_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    planets = [planet] if planet else list(STATIONARY_PLANETS)
+    found = sorted((s for p in planets for s in finder.find(p, f, t)), key=lambda s: s.jd)
+    for station in found:
+        sign = sign_from_longitude(station.sidereal_longitude)
+        typer.echo(
+            f"{station.instant:%Y-%m-%d %H:%M} UTC  {station.planet:8} stationary {station.direction:10} "
+            f"at {station.sidereal_longitude % 30:5.2f} {sign}"
+        )
+
+
 @app.command("match")
 def match(profile: str = typer.Option(..., "--profile"), with_profile: str = typer.Option(..., "--with")) -> None:
     """Calculate Ashta Kuta compatibility between two profiles."""
@@ -262,15 +625,8 @@ def chat() -> None:
 
         if "current dasha" in lower and "profile:" in lower:
             name = question.split("profile:")[-1].strip()
-            p = store.get_by_name(name)
-            if p.chart is None:
-                p.chart = _build_chart(p.name, p.birth_details)
-                store.upsert(p)
-            moon_lon = next(x.sidereal_longitude for x in p.chart.planet_positions if x.planet_name == "Moon")
-            lord = dasha_lord_from_moon_nakshatra(int(moon_lon // 13.3333333333))
-            periods = build_vimshottari_periods(lord, to_utc_datetime(str(p.birth_details.date_of_birth), p.birth_details.time_of_birth.isoformat(), p.birth_details.timezone))
-            maha, antar = current_dasha(periods, datetime.now(timezone.utc))
-            response = render_dasha_now(maha.lord if maha else "Unknown", antar.lord if antar else None)
+            path = _dasha_tree(store, store.get_by_name(name)).at(julian_day(datetime.now(timezone.utc)))
+            response = render_dasha_now(path[0].lord if path else "Unknown", path[1].lord if len(path) > 1 else None)
         elif "life overview" in lower and "profile:" in lower:
             name = question.split("profile:")[-1].strip()
             p = store.get_by_name(name)
@@ -326,3 +682,137 @@ def schema(out_dir: str = typer.Option("raajeeb_astro_prime/schemas", "--out-dir
     for name, payload in files.items():
         (target / name).write_text(json.dumps(payload, indent=2), encoding="utf-8")
     typer.echo(f"Wrote {len(files)} schema files to {target}")
+
+
+@ephemeris_app.command("compile")
+def ephemeris_compile(
+    source: str = typer.Option("swiss", "--source", help="swiss or csv"),
+    from_date: Optional[str] = typer.Option(None, "--from", help="YYYY-MM-DD (required for swiss)"),
+    to_date: Optional[str] = typer.Option(None, "--to", help="YYYY-MM-DD (required for swiss)"),
+    out: Optional[str] = typer.Option(None, "--out"),
+) -> None:
+    """Compile the CSV or a Swiss-generated range into a memory-mappable binary table."""
+    settings = get_settings()
+    if source == "csv":
+        if out is None:
+            # The binary tier ranks ahead of Swiss, so sample CSV rows there would shadow it.
+            raise typer.BadParameter("A CSV-sourced table cannot replace the default binary tier; pass --out.")
+        backend = CsvEphemerisBackend(settings.ephemeris_csv, interpolate=True)
+        start, end = backend.date_range()
+    elif source == "swiss":
+        if not from_date or not to_date:
+            raise typer.BadParameter("--from and --to are required for --source swiss.")
+        backend = SwissEphemerisBackend()
+        start, end = None, None
+    else:
+        raise typer.BadParameter("--source must be csv or swiss.")
+    if from_date:
+        start = datetime.strptime(from_date, "%Y-%m-%d").date()
+    if to_date:
+        end = datetime.strptime(to_date, "%Y-%m-%d").date()
+    target = Path(out) if out else settings.ephemeris_bin
+    days = compile_binary_ephemeris(backend, start, end, target)
+    typer.echo(f"Wrote {days} days ({start} .. {end}) to {target}")
+
+
+@ephemeris_app.command("chebyshev")
+def ephemeris_chebyshev(
+    from_date: str = typer.Option("1800-01-01", "--from"),
+    to_date: str = typer.Option("2200-12-31", "--to"),
+    out: Optional[str] = typer.Option(None, "--out"),
+) -> None:
+    """Fit Chebyshev segments to Swiss Ephemeris for offline deployments."""
+    settings = get_settings()
+    start = julian_day(datetime.strptime(from_date, "%Y-%m-%d").replace(tzinfo=timezone.utc))
+    end = julian_day(datetime.strptime(to_date, "%Y-%m-%d").replace(tzinfo=timezone.utc))
+    target = Path(out) if out else settings.ephemeris_chebyshev
+    series = fit_chebyshev_ephemeris(start, end)
+    save_chebyshev_ephemeris(target, series)
+    size_mb = target.stat().st_size / 1e6
+    typer.echo(f"Wrote {len(series)} bodies ({from_date} .. {to_date}, {size_mb:.1f} MB) to {target}")
+
+
+@ephemeris_app.command("tiers")
+def ephemeris_tiers() -> None:
+    """List ephemeris sources in lookup order with their covered date ranges."""
+    backend = _ephemeris_backend(get_settings()).backend
+    for name, source in backend.tiers:
+        span = source.date_range()
+        typer.echo(f"{name:10} {f'{span[0]} .. {span[1]}' if span else 'unbounded'}")
+
+
+@bench_app.command("csv-interpolation")
+def bench_csv_interpolation(
+    days: int = typer.Option(120, "--days"),
+    samples: int = typer.Option(500, "--samples"),
+) -> None:
+    """Report interpolated CSV accuracy and per-call cost against Swiss Ephemeris."""
+    from raajeeb_astro_prime.benchmarks import bench_csv_interpolation as run
+
+    report = run(days=days, samples=samples)
+    typer.echo("planet   | max err deg | daily-row err deg | max speed err deg/day")
+    for planet, row in report["errors"].items():
+        typer.echo(f"{planet:8} | {row['max_lon']:11.6f} | {row['max_lon_daily']:17.4f} | {row['max_speed']:.6f}")
+    for name, value in report["timings"].items():
+        typer.echo(f"{name}: {value:.1f} us/call")
+
+
+@bench_app.command("chebyshev")
+def bench_chebyshev(
+    planet: str = typer.Option("Moon", "--planet"),
+    years: int = typer.Option(20, "--years"),
+    samples: int = typer.Option(2000, "--samples"),
+) -> None:
+    """Compare Chebyshev segment length and degree choices for one body."""
+    from raajeeb_astro_prime.benchmarks import bench_chebyshev as run
+
+    segment_days, degree = DEFAULT_SEGMENTS[planet]
+    layouts = [(segment_days * f, degree + d) for f, d in ((0.5, -2), (0.5, 0), (1, -2), (1, 0), (1, 2), (2, 0), (2, 2))]
+    typer.echo("segment days | degree | max err arcsec | max speed err deg/day | ns/eval | MB per 400y")
+    for row in run(planet, layouts, years=years, samples=samples):
+        typer.echo(
+            f"{row['segment_days']:12.1f} | {row['degree']:6} | {row['max_err_arcsec']:14.4f} | "
+            f"{row['max_speed_err']:21.6f} | {row['ns_per_eval']:7.0f} | {row['mb_per_400y']:.2f}"
+        )
+
+
+@bench_app.command("planet-subset")
+def bench_planet_subset(
+    days: int = typer.Option(3650, "--days"),
+    step_hours: float = typer.Option(24.0, "--step-hours"),
+) -> None:
+    """Compare full-sky and single-planet Swiss range scans."""
+    from raajeeb_astro_prime.benchmarks import bench_planet_subset as run
+
+    typer.echo("subset    | instants | seconds | speedup")
+    for row in run(days=days, step_hours=step_hours):
+        typer.echo(f"{row['subset']:9} | {row['instants']:8} | {row['seconds']:7.3f} | {row['speedup']:.1f}x")
+
+
+@bench_app.command("ascendant")
+def bench_ascendant(count: int = typer.Option(100_000, "--count")) -> None:
+    """Report batched versus scalar ascendant throughput and accuracy against Swiss houses."""
+    from raajeeb_astro_prime.benchmarks import bench_ascendant as run
+
+    report = run(count=count)
+    typer.echo(f"lagnas: {int(report['count'])}")
+    typer.echo(f"batched: {report['batch_ns_per_lagna']:.0f} ns/lagna")
+    typer.echo(f"scalar:  {report['scalar_ns_per_lagna']:.0f} ns/lagna")
+    if "max_err_arcsec" in report:
+        typer.echo(f"max error vs Swiss: {report['max_err_arcsec']:.2f} arcsec")
+
+
+@bench_app.command("dasha")
+def bench_dasha(
+    births: int = typer.Option(2000, "--births"),
+    lookups: int = typer.Option(20, "--lookups"),
+    batch_births: int = typer.Option(100_000, "--batch-births"),
+) -> None:
+    """Compare dasha systems on tree build, prana-depth lookup and batch evaluation."""
+    from raajeeb_astro_prime.benchmarks import bench_dasha as run
+
+    typer.echo("system      | build us | lookup us | rows/tree | batch ns/birth")
+    for row in run(births=births, lookups=lookups, batch_births=batch_births):
+        typer.echo(
+            f"{row['system']:11} | {row['build_us']:8.1f} | {row['lookup_us']:9.2f} | {row['rows_per_tree']:9.0f} | {row['batch_ns']:.0f}"
+        )
@@ -16,6 +16,13 @@ class AppSettings(BaseModel):
     default_timezone: str = "Asia/Kolkata"
     profile_store: Path = Field(default_factory=lambda: Path("profiles.json"))
     ephemeris_csv: Path = Field(default_factory=lambda: Path("raajeeb_astro_prime/data/ephemeris.csv"))
+    ephemeris_bin: Path = Field(default_factory=lambda: Path("raajeeb_astro_prime/data/ephemeris.bin"))
+    ephemeris_chebyshev: Path = Field(default_factory=lambda: Path("raajeeb_astro_prime/data/ephemeris_chebyshev.npz"))
+    ephemeris_interpolate: bool = True
+    # The bundled CSV is sample data, so it only answers what nothing else covers.
+    ephemeris_tiers: tuple[str, ...] = ("binary", "chebyshev", "swiss", "csv")
+    sky_cache_quantum_seconds: int = 60
+    sky_cache_size: int = 4096
     vedic_yogas_csv: Path = Field(default_factory=lambda: Path("raajeeb_astro_prime/data/vedic_yogas.csv"))
     remedies_csv: Path = Field(default_factory=lambda: Path("raajeeb_astro_prime/data/lal_kitab_remedies.csv"))
     remedies_matrix_csv: Path = Field(default_factory=lambda: Path("raajeeb_astro_prime/data/lalkitab_remedies_matrix.csv"))
@@ -15,6 +15,7 @@ class BirthDetails(BaseModel):
     timezone: str
     latitude: float
     longitude: float
+    dst_fold: Optional[int] = Field(default=None, ge=0, le=1, description="Occurrence of an ambiguous local time")
     gender: Optional[str] = None
     notes: Optional[str] = None
 
@@ -41,13 +42,15 @@ class Chart(BaseModel):
     moon_sign: str
     sun_sign: str
     planet_positions: list[PlanetPosition]
+    lagna_longitude: Optional[float] = None
+    vargas: dict[str, dict[str, str]] = Field(default_factory=dict, description="Varga -> body (planets and Lagna) -> sign")
 
 
 class DashaPeriod(BaseModel):
-    """Vimshottari period at maha/antar/pratyantar levels."""
+    """Dasha period of any supported system at maha/antar/pratyantar/sookshma/prana levels."""
 
     id: str
-    level: Literal["maha", "antar", "pratyantar"]
+    level: Literal["maha", "antar", "pratyantar", "sookshma", "prana"]
     lord: str
     start_datetime: datetime
     end_datetime: datetime
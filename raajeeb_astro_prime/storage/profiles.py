@@ -36,6 +36,10 @@ class ProfileStore:
         """Return all profiles."""
         return self._read()
 
+    def records(self) -> list[dict]:
+        """Return raw profile records without model validation, for store-wide scans."""
+        return json.loads(self.path.read_text(encoding="utf-8"))
+
     def get_by_name(self, name: str) -> Profile:
         """Find a profile by case-insensitive name."""
         profiles = self._read()